@@ -1,7 +1,7 @@
 import json
 import os
 import datetime
-from PyQt5.QtCore import QObject, QTimer, pyqtSignal, QDateTime, QTime, QDate
+from PyQt5.QtCore import Qt, QObject, QTimer, pyqtSignal, QDateTime, QTime, QDate
 
 class Bell:
     def __init__(self, name, time, sound="default.mp3", days=None, category="Default", 
@@ -76,11 +76,19 @@ class BellScheduler(QObject):
         self.next_bell = None
         self.seconds_to_next = 0
         
-        # Create timer for checking bells (every second)
+        # Create timer for refreshing the next bell countdown (every second)
         self.check_timer = QTimer()
+        self.check_timer.setTimerType(Qt.CoarseTimer)
         self.check_timer.timeout.connect(self.check_bells)
         self.check_timer.start(1000)
         
+        # Precise single-shot timer, re-armed for each upcoming bell
+        self.bell_timer = QTimer()
+        self.bell_timer.setTimerType(Qt.PreciseTimer)
+        self.bell_timer.setSingleShot(True)
+        self.bell_timer.timeout.connect(self.ring_due_bells)
+        self.armed_time = None
+        
         # Load bells from file
         self.load_bells()
         
@@ -126,8 +134,15 @@ class BellScheduler(QObject):
             json.dump(bells_data, f, indent=4)
         
     def check_bells(self):
-        """Check if any bells need to be triggered"""
-        current_time = QTime.currentTime()
+        """Refresh the next bell; ringing is driven by the precise bell timer"""
+        self.update_next_bell()
+        
+    def ring_due_bells(self):
+        """Trigger every bell scheduled for the time the bell timer was armed for"""
+        ring_time = self.armed_time
+        if ring_time is None:
+            return
+            
         current_day = QDate.currentDate().toString("dddd")
         
         for bell in self.bells:
@@ -139,12 +154,12 @@ class BellScheduler(QObject):
             if current_day not in bell.days:
                 continue
                 
-            # Check if bell time matches current time (ignoring seconds)
-            if bell.time.hour() == current_time.hour() and bell.time.minute() == current_time.minute() and current_time.second() == 0:
+            # Check if bell time matches the armed time (ignoring seconds)
+            if bell.time.hour() == ring_time.hour() and bell.time.minute() == ring_time.minute():
                 self.bell_triggered.emit(bell)
                 print(f"Bell triggered: {bell.name}")
         
-        # Update next bell info
+        # Update next bell info and re-arm the timer
         self.update_next_bell()
         
     def update_next_bell(self):
@@ -175,6 +190,20 @@ class BellScheduler(QObject):
             
             if next_bell:
                 self.next_bell_changed.emit(next_bell, min_seconds)
+        
+        # Arm the bell timer once per upcoming bell time
+        if next_bell is None:
+            self.bell_timer.stop()
+            self.armed_time = None
+            return
+            
+        expected_ms = max(0, min_seconds * 1000 - current_time.msec())
+        if next_bell.time != self.armed_time or (not self.bell_timer.isActive() and min_seconds > 1):
+            self.armed_time = next_bell.time
+            self.bell_timer.start(expected_ms)
+        elif self.bell_timer.isActive() and abs(self.bell_timer.remainingTime() - expected_ms) > 500:
+            # QTimer runs on the monotonic clock; re-arm after wall-clock steps or suspend/resume
+            self.bell_timer.start(expected_ms)
     
     def seconds_until_time(self, current, target):
         """Calculate seconds until target time from current time"""
@@ -8,6 +8,32 @@ import pygame
 import time
 import contextlib
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _mix_layers(buffers, volumes):
+    """Sum the rows of a (layers, samples) float32 buffer weighted by volume"""
+    return volumes @ buffers
+
+
+if numba is not None:
+    @numba.njit(fastmath=True, cache=True)
+    def _mix_kernel(out, buffers, volumes, n):
+        for i in range(n):
+            s = 0.0
+            for j in range(buffers.shape[0]):
+                s += buffers[j, i] * volumes[j]
+            out[i] = s
+            
+    def _mix_layers(buffers, volumes):
+        """Sum the rows of a (layers, samples) float32 buffer weighted by volume"""
+        out = np.empty(buffers.shape[1], dtype=np.float32)
+        _mix_kernel(out, buffers, volumes, buffers.shape[1])
+        return out
+
 class SoundEffect:
     """Represents a sound effect that can be applied to a bell sound"""
     
@@ -21,7 +47,7 @@ class SoundEffect:
         return {
             "name": self.name,
             "type": self.type,
-            "parameters": self.parameters
+            "parameters": dict(self.parameters)
         }
         
     @classmethod
@@ -126,7 +152,7 @@ class SoundMixer(QObject):
         
         Args:
             sound_files: List of sound file paths
-            volumes: List of volume percentages (0-100) for each sound
+            volumes: List or array of volume percentages (0-100) for each sound
             output_path: Where to save the mixed sound (temp file if None)
             effects: List of SoundEffect objects to apply
             
@@ -142,10 +168,10 @@ class SoundMixer(QObject):
                 volumes = [100] * len(sound_files)
                 
             if len(volumes) != len(sound_files):
-                volumes = volumes + [100] * (len(sound_files) - len(volumes))
+                volumes = list(volumes) + [100] * (len(sound_files) - len(volumes))
                 
             # Convert volume percentages to factors (0.0-1.0)
-            volume_factors = [v / 100 for v in volumes]
+            volume_factors = np.asarray(volumes, dtype=np.float32) / 100
             
             # Ensure files exist and expand relative paths
             full_paths = []
@@ -196,8 +222,8 @@ class SoundMixer(QObject):
                         # Convert mono to stereo
                         data = np.column_stack((data, data))
                         
-                    # Apply volume
-                    data = data * volume_factors[i]
+                    # Work in float32, volume is applied when the layers are mixed
+                    data = data.astype(np.float32)
                     
                     # Apply effects
                     if effects:
@@ -208,16 +234,13 @@ class SoundMixer(QObject):
                     sound_data.append(data)
                     max_length = max(max_length, len(data))
             
-            # Pad shorter sounds to max length
-            for i in range(len(sound_data)):
-                if len(sound_data[i]) < max_length:
-                    padding = np.zeros((max_length - len(sound_data[i]), 2), dtype=sound_data[i].dtype)
-                    sound_data[i] = np.vstack((sound_data[i], padding))
+            # Pack all sounds into one contiguous buffer, padding shorter ones with silence
+            buffers = np.zeros((len(sound_data), max_length * 2), dtype=np.float32)
+            for i, data in enumerate(sound_data):
+                buffers[i, :data.size] = data.reshape(-1)
             
             # Mix all sounds
-            mixed_data = np.zeros((max_length, 2), dtype=np.float32)
-            for data in sound_data:
-                mixed_data += data.astype(np.float32)
+            mixed_data = _mix_layers(buffers, volume_factors).reshape(-1, 2)
                 
             # Normalize to prevent clipping
             max_value = np.max(np.abs(mixed_data))
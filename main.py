@@ -5,7 +5,6 @@ from PyQt5.QtCore import QTimer
 
 # Import modules
 from ui.splash_screen import SplashScreen
-from ui.main_window import MainWindow
 
 # Create application
 app = QApplication(sys.argv)
@@ -13,9 +12,18 @@ app = QApplication(sys.argv)
 # Create and show splash screen
 splash = SplashScreen()
 splash.show()
+splash.setProgress(10)
+app.processEvents()
+
+# Import the main window while the splash is visible
+from ui.main_window import MainWindow, MAINWINDOW_QSS
+from ui.zone_manager_styles import load_zone_manager_qss
+app.setStyleSheet(MAINWINDOW_QSS + load_zone_manager_qss())
+splash.setProgress(40)
 
 # Create and initialize main window
 main_window = MainWindow()
+splash.setProgress(100)
 
 # Function to close splash and show main window
 def finish_splash():
@@ -0,0 +1,24 @@
+import os
+import sys
+
+from PyQt5.QtWidgets import QApplication
+
+# Allow running as `python tools/build_splash.py` from the project root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ui.splash_screen import SPLASH_PIXMAP_PATH, paint_splash_pixmap
+
+def build_splash(output_path=SPLASH_PIXMAP_PATH):
+    """Render the splash image once and save it as a PNG"""
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    
+    pixmap = paint_splash_pixmap()
+    if not pixmap.save(output_path, "PNG"):
+        raise IOError(f"Could not save splash image to {output_path}")
+    
+    print(f"Created splash image: {output_path}")
+
+if __name__ == "__main__":
+    # QPixmap needs a GUI application instance
+    app = QApplication(sys.argv)
+    build_splash()
@@ -0,0 +1,78 @@
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _bin_starts(num_samples, target):
+    """Start index of each of the target envelope bins"""
+    return np.arange(target, dtype=np.int64) * num_samples // target
+
+
+def reduce_envelope(samples, target, out_min, out_max):
+    """Reduce samples to target min/max bins, written into out_min/out_max"""
+    starts = _bin_starts(len(samples), target)
+    out_min[:] = np.minimum.reduceat(samples, starts)
+    out_max[:] = np.maximum.reduceat(samples, starts)
+
+
+def window_frames(samples, nfft, step, window, out):
+    """Fill out with overlapping nfft-sample frames of samples times window"""
+    frames = np.lib.stride_tricks.sliding_window_view(samples, nfft)[::step]
+    np.multiply(frames, window, out=out)
+
+
+def power_to_db(spec, out):
+    """Write 10 * log10(|spec|^2 + 1e-12) into out"""
+    np.abs(spec, out=out)
+    np.square(out, out=out)
+    out += np.float32(1e-12)
+    np.log10(out, out=out)
+    out *= np.float32(10)
+
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _reduce_envelope_kernel(samples, target, out_min, out_max):
+        n = samples.shape[0]
+        for i in range(target):
+            start = i * n // target
+            end = (i + 1) * n // target
+            lo = samples[start]
+            hi = samples[start]
+            for k in range(start + 1, end):
+                v = samples[k]
+                if v < lo:
+                    lo = v
+                elif v > hi:
+                    hi = v
+            out_min[i] = lo
+            out_max[i] = hi
+            
+    def reduce_envelope(samples, target, out_min, out_max):
+        """Reduce samples to target min/max bins, written into out_min/out_max"""
+        _reduce_envelope_kernel(samples, target, out_min, out_max)
+        
+    @numba.njit(fastmath=True, cache=True)
+    def _window_frames_kernel(samples, nfft, step, window, out):
+        for f in range(out.shape[0]):
+            start = f * step
+            for k in range(nfft):
+                out[f, k] = samples[start + k] * window[k]
+                
+    @numba.njit(fastmath=True, cache=True)
+    def _power_to_db_kernel(spec, out):
+        for f in range(spec.shape[0]):
+            for k in range(spec.shape[1]):
+                c = spec[f, k]
+                out[f, k] = 10.0 * np.log10(c.real * c.real + c.imag * c.imag + 1e-12)
+                
+    def window_frames(samples, nfft, step, window, out):
+        """Fill out with overlapping nfft-sample frames of samples times window"""
+        _window_frames_kernel(samples, nfft, step, window, out)
+        
+    def power_to_db(spec, out):
+        """Write 10 * log10(|spec|^2 + 1e-12) into out"""
+        _power_to_db_kernel(spec, out)
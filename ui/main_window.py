@@ -1,15 +1,97 @@
 from PyQt5.QtWidgets import (
-    QMainWindow, QPushButton, QVBoxLayout, QHBoxLayout, QWidget, QLabel, 
-    QListWidget, QListWidgetItem, QFrame, QSplitter, QScrollArea, QTabWidget,
-    QTimeEdit, QLineEdit, QComboBox, QSlider, QGroupBox, QSpinBox, QMenuBar,
-    QMenu, QAction, QSystemTrayIcon, QMessageBox, QSizePolicy, QFileDialog,
-    QToolButton, QGridLayout
+    QMainWindow, QPushButton, QVBoxLayout, QHBoxLayout, QGridLayout, QWidget,
+    QLabel, QListWidget, QFrame, QTabWidget, QMenu, QAction,
+    QSystemTrayIcon, QApplication
 )
-from PyQt5.QtCore import Qt, QTime, QTimer, QSize, QDateTime, QDate
-from PyQt5.QtGui import QIcon, QFont, QColor, QPalette, QPixmap
-import json
-import os
-import sys
+from PyQt5.QtCore import Qt, QTimer, QDateTime, QThread, pyqtSignal
+from PyQt5.QtGui import QFont
+from functools import lru_cache
+
+# Sample bells shown in the bell list, formatted once at import
+_SAMPLE_BELL_STRINGS = tuple(f"{time} - {name}" for time, name in (
+    ("09:00 AM", "School Start"),
+    ("10:30 AM", "Period 1"),
+    ("11:20 AM", "Break"),
+    ("11:35 AM", "Period 2"),
+    ("12:25 PM", "Lunch"),
+    ("13:10 PM", "Period 3"),
+    ("14:00 PM", "End of Day")
+))
+
+@lru_cache(maxsize=None)
+def _label_font(pixel_size, bold=False):
+    """Return a shared label font, built once per size/weight"""
+    font = QFont()
+    font.setPixelSize(pixel_size)
+    font.setBold(bold)
+    return font
+
+# Application-level stylesheet for the main window, scoped by object name
+MAINWINDOW_QSS = """
+    #mainWindow, #mainWindow QWidget {
+        background-color: #121220;
+        color: white;
+    }
+    #mainWindow QPushButton {
+        background-color: #2d2d40;
+        color: white;
+        border-radius: 5px;
+        padding: 8px;
+    }
+    #mainWindow QPushButton:hover {
+        background-color: #3d3d50;
+    }
+    #mainWindow QTabWidget::pane {
+        background-color: #1a1a2a;
+        border: 1px solid #353550;
+        border-radius: 5px;
+    }
+    #mainWindow QTabBar::tab {
+        background-color: #252535;
+        color: white;
+        padding: 8px 16px;
+        margin-right: 2px;
+        border-top-left-radius: 5px;
+        border-top-right-radius: 5px;
+    }
+    #mainWindow QTabBar::tab:selected {
+        background-color: #353550;
+    }
+    QFrame#separator {
+        background-color: #353550;
+        max-height: 1px;
+    }
+    QLabel#currentTime {
+        color: white;
+    }
+    QLabel#currentDate {
+        color: #8080a0;
+    }
+    QLabel#statusLabel {
+        background-color: #00a05030;
+        color: #00ffee;
+        padding: 5px 10px;
+        border-radius: 10px;
+        font-weight: bold;
+    }
+    #statusBar, #statusBar QLabel {
+        background-color: #252535;
+        border-top: 1px solid #353550;
+    }
+"""
+
+class TickThread(QThread):
+    """Emits the current date and time once per second from its own event loop"""
+    
+    tick = pyqtSignal(QDateTime)
+    
+    def run(self):
+        timer = QTimer()
+        timer.setTimerType(Qt.CoarseTimer)
+        timer.timeout.connect(lambda: self.tick.emit(QDateTime.currentDateTime()))
+        timer.start(1000)
+        self.exec_()
+        timer.stop()
 
 class CustomTitleBar(QWidget):
     def __init__(self, parent):
@@ -17,13 +99,15 @@ class CustomTitleBar(QWidget):
         self.parent = parent
         
         # Set up layout
-        self.layout = QHBoxLayout(self)
+        self.layout = QGridLayout(self)
         self.layout.setContentsMargins(0, 0, 0, 0)
+        self.layout.setSpacing(0)
         
         # Add title
         self.title = QLabel("DPMMV Bells System")
         self.title.setAlignment(Qt.AlignCenter)
-        self.title.setStyleSheet("font-size: 14px; font-weight: bold; color: #00a0ff;")
+        self.title.setFont(_label_font(14, True))
+        self.title.setStyleSheet("color: #00a0ff;")
         
         # Add buttons
         self.minimize_btn = QPushButton("—")
@@ -39,12 +123,11 @@ class CustomTitleBar(QWidget):
         self.close_btn.clicked.connect(self.parent.close)
         
         # Add to layout
-        self.layout.addSpacing(5)
-        self.layout.addWidget(self.title)
-        self.layout.addStretch()
-        self.layout.addWidget(self.minimize_btn)
-        self.layout.addWidget(self.maximize_btn)
-        self.layout.addWidget(self.close_btn)
+        self.layout.addWidget(self.title, 0, 0)
+        self.layout.addWidget(self.minimize_btn, 0, 1)
+        self.layout.addWidget(self.maximize_btn, 0, 2)
+        self.layout.addWidget(self.close_btn, 0, 3)
+        self.layout.setColumnStretch(0, 1)
         
         # Style the widgets
         self.setStyleSheet("""
@@ -63,6 +146,9 @@ class CustomTitleBar(QWidget):
         """)
         self.close_btn.setObjectName("close_btn")
         
+        # Pending window position while dragging, applied at most once per frame
+        self._pending_pos = None
+        
     def toggle_maximize(self):
         if self.parent.isMaximized():
             self.parent.showNormal()
@@ -71,13 +157,29 @@ class CustomTitleBar(QWidget):
             
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
+            # Let the window manager drag the window when supported (Qt >= 5.15)
+            window = self.parent.windowHandle()
+            if window is not None and hasattr(window, "startSystemMove") and window.startSystemMove():
+                self.parent.drag_position = None
+                event.accept()
+                return
+                
             self.parent.drag_position = event.globalPos() - self.parent.frameGeometry().topLeft()
             event.accept()
             
     def mouseMoveEvent(self, event):
-        if event.buttons() == Qt.LeftButton:
-            self.parent.move(event.globalPos() - self.parent.drag_position)
+        if event.buttons() == Qt.LeftButton and self.parent.drag_position is not None:
+            # Coalesce bursts of move events into a single move per frame
+            if self._pending_pos is None:
+                QTimer.singleShot(16, self._apply_pending_move)
+            self._pending_pos = event.globalPos() - self.parent.drag_position
             event.accept()
+            
+    def _apply_pending_move(self):
+        """Move the window to the last position recorded while dragging"""
+        if self._pending_pos is not None:
+            self.parent.move(self._pending_pos)
+            self._pending_pos = None
 
 class NextBellWidget(QFrame):
     def __init__(self, parent=None):
@@ -94,19 +196,23 @@ class NextBellWidget(QFrame):
         
         # Add header
         self.header = QLabel("Next Bell")
-        self.header.setStyleSheet("font-size: 16px; font-weight: bold; color: #00a0ff;")
+        self.header.setFont(_label_font(16, True))
+        self.header.setStyleSheet("color: #00a0ff;")
         
         # Add bell name
         self.bell_name = QLabel("Period 1")
-        self.bell_name.setStyleSheet("font-size: 24px; font-weight: bold; color: white;")
+        self.bell_name.setFont(_label_font(24, True))
+        self.bell_name.setStyleSheet("color: white;")
         
         # Add countdown
         self.countdown = QLabel("00:15:22")
-        self.countdown.setStyleSheet("font-size: 36px; font-weight: bold; color: #00ffee;")
+        self.countdown.setFont(_label_font(36, True))
+        self.countdown.setStyleSheet("color: #00ffee;")
         
         # Add time
         self.time = QLabel("10:30 AM")
-        self.time.setStyleSheet("font-size: 18px; color: #8080a0;")
+        self.time.setFont(_label_font(18))
+        self.time.setStyleSheet("color: #8080a0;")
         
         # Add to layout
         self.layout.addWidget(self.header, alignment=Qt.AlignCenter)
@@ -130,7 +236,8 @@ class BellListWidget(QFrame):
         # Add header with controls
         self.header_layout = QHBoxLayout()
         self.title = QLabel("Today's Bells")
-        self.title.setStyleSheet("font-size: 16px; font-weight: bold; color: #00a0ff;")
+        self.title.setFont(_label_font(16, True))
+        self.title.setStyleSheet("color: #00a0ff;")
         
         self.add_btn = QPushButton("+ Add Bell")
         self.add_btn.setStyleSheet("""
@@ -173,17 +280,9 @@ class BellListWidget(QFrame):
         """)
         
         # Add sample bells
-        for i, (time, name) in enumerate([
-            ("09:00 AM", "School Start"),
-            ("10:30 AM", "Period 1"),
-            ("11:20 AM", "Break"),
-            ("11:35 AM", "Period 2"),
-            ("12:25 PM", "Lunch"),
-            ("13:10 PM", "Period 3"),
-            ("14:00 PM", "End of Day")
-        ]):
-            item = QListWidgetItem(f"{time} - {name}")
-            self.bell_list.addItem(item)
+        self.bell_list.setUpdatesEnabled(False)
+        self.bell_list.addItems(list(_SAMPLE_BELL_STRINGS))
+        self.bell_list.setUpdatesEnabled(True)
         
         # Add to layout
         self.layout.addLayout(self.header_layout)
@@ -194,47 +293,16 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.drag_position = None
         
+        # Defer painting until the whole window has been built
+        self.setUpdatesEnabled(False)
+        
         # Set window properties
         self.setWindowTitle("DPMMV Bells System")
         self.setWindowFlags(Qt.FramelessWindowHint)
         self.setMinimumSize(900, 600)
         
-        # Set up dark theme
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #121220;
-                color: white;
-            }
-            QWidget {
-                background-color: #121220;
-                color: white;
-            }
-            QPushButton {
-                background-color: #2d2d40;
-                color: white;
-                border-radius: 5px;
-                padding: 8px;
-            }
-            QPushButton:hover {
-                background-color: #3d3d50;
-            }
-            QTabWidget::pane {
-                background-color: #1a1a2a;
-                border: 1px solid #353550;
-                border-radius: 5px;
-            }
-            QTabBar::tab {
-                background-color: #252535;
-                color: white;
-                padding: 8px 16px;
-                margin-right: 2px;
-                border-top-left-radius: 5px;
-                border-top-right-radius: 5px;
-            }
-            QTabBar::tab:selected {
-                background-color: #353550;
-            }
-        """)
+        # Dark theme rules live in MAINWINDOW_QSS, applied once at application level
+        self.setObjectName("mainWindow")
         
         # Create central widget and main layout
         self.central_widget = QWidget()
@@ -250,7 +318,7 @@ class MainWindow(QMainWindow):
         self.separator = QFrame()
         self.separator.setFrameShape(QFrame.HLine)
         self.separator.setFrameShadow(QFrame.Sunken)
-        self.separator.setStyleSheet("background-color: #353550; max-height: 1px;")
+        self.separator.setObjectName("separator")
         self.main_layout.addWidget(self.separator)
         
         # Create content widget with margins
@@ -262,19 +330,15 @@ class MainWindow(QMainWindow):
         self.header_layout = QHBoxLayout()
         
         self.current_time = QLabel("10:30:15 AM")
-        self.current_time.setStyleSheet("font-size: 24px; font-weight: bold; color: white;")
+        self.current_time.setObjectName("currentTime")
+        self.current_time.setFont(_label_font(24, True))
         
         self.current_date = QLabel("Monday, May 10, 2025")
-        self.current_date.setStyleSheet("font-size: 16px; color: #8080a0;")
+        self.current_date.setObjectName("currentDate")
+        self.current_date.setFont(_label_font(16))
         
         self.status_label = QLabel("All Bells Active")
-        self.status_label.setStyleSheet("""
-            background-color: #00a05030;
-            color: #00ffee;
-            padding: 5px 10px;
-            border-radius: 10px;
-            font-weight: bold;
-        """)
+        self.status_label.setObjectName("statusLabel")
         
         self.header_layout.addWidget(self.current_time)
         self.header_layout.addWidget(self.current_date)
@@ -326,12 +390,10 @@ class MainWindow(QMainWindow):
         self.main_layout.addWidget(self.content_widget)
         
         # Set up status bar
-        self.status_bar = QFrame()
-        self.status_bar.setStyleSheet("""
-            background-color: #252535;
-            max-height: 25px;
-            border-top: 1px solid #353550;
-        """)
+        self.status_bar = QWidget()
+        self.status_bar.setObjectName("statusBar")
+        self.status_bar.setFixedHeight(25)
+        self.status_bar.setAttribute(Qt.WA_StyledBackground, True)
         self.status_bar_layout = QHBoxLayout(self.status_bar)
         self.status_bar_layout.setContentsMargins(10, 0, 10, 0)
         
@@ -347,14 +409,22 @@ class MainWindow(QMainWindow):
         # Create system tray icon
         self.setup_tray_icon()
         
-        # Set up timers for date and time
-        self.time_timer = QTimer(self)
-        self.time_timer.timeout.connect(self.update_time)
-        self.time_timer.start(1000)
+        # Bind the clock update calls once, update_time runs every second
+        self._now_fn = QDateTime.currentDateTime
+        self._set_time = self.current_time.setText
+        self._set_date = self.current_date.setText
+        
+        # Drive the clock from a dedicated thread so GUI stalls don't delay it
+        self.tick_thread = TickThread(self)
+        self.tick_thread.tick.connect(self.update_time_from_signal, Qt.QueuedConnection)
+        self.tick_thread.start()
+        QApplication.instance().aboutToQuit.connect(self.stop_tick_thread)
         
         # Update time at start
         self.update_time()
         
+        self.setUpdatesEnabled(True)
+        
     def setup_tray_icon(self):
         """Set up system tray icon and menu"""
         self.tray_icon = QSystemTrayIcon(self)
@@ -400,15 +470,26 @@ class MainWindow(QMainWindow):
             self.show()
             self.activateWindow()
             
+    def stop_tick_thread(self):
+        """Stop the clock thread before Qt tears the window down"""
+        self.tick_thread.quit()
+        self.tick_thread.wait()
+        
     def close_application(self):
         """Close the application completely"""
         self.tray_icon.hide()
-        QApplication.quit()
+        self.stop_tick_thread()
+        QApplication.instance().quit()
         
     def closeEvent(self, event):
         """Handle close event to minimize to tray instead of closing"""
         event.ignore()
         self.hide()
+        # Post the notification so the hide is not held up by the platform toast
+        QTimer.singleShot(0, self._show_tray_notify)
+        
+    def _show_tray_notify(self):
+        """Notify the user that the application is still running in the tray"""
         self.tray_icon.showMessage(
             "DPMMV Bells System",
             "Application minimized to tray. Bells will continue to play.",
@@ -418,6 +499,9 @@ class MainWindow(QMainWindow):
         
     def update_time(self):
         """Update the current time and date display"""
-        now = QDateTime.currentDateTime()
-        self.current_time.setText(now.toString("hh:mm:ss AP"))
-        self.current_date.setText(now.toString("dddd, MMMM d, yyyy"))
\ No newline at end of file
+        self.update_time_from_signal(self._now_fn())
+        
+    def update_time_from_signal(self, now):
+        """Update the time and date display from a clock tick"""
+        self._set_time(now.toString("hh:mm:ss AP"))
+        self._set_date(now.toString("dddd, MMMM d, yyyy"))
\ No newline at end of file
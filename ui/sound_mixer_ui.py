@@ -1,16 +1,158 @@
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame,
     QScrollArea, QSlider, QFileDialog, QComboBox, QMessageBox,
-    QListWidget, QListWidgetItem, QMenu, QSpinBox, QCheckBox,
-    QGroupBox, QFormLayout, QTabWidget, QSplitter, QDoubleSpinBox,
-    QProgressBar, QLineEdit, QColorDialog
+    QProgressBar, QLineEdit
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer
-from PyQt5.QtGui import QPixmap, QFont, QColor, QPalette
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QObject, QRunnable, QThreadPool, QThread
 
 import os
+import itertools
+import pathlib
+import shutil
+import types
+import numpy as np
+import pygame
 from core.sound_mixer import SoundMixer, SoundEffect
 
+# Stylesheets shared by every widget instance
+_LAYER_FRAME_STYLE = """
+    background-color: #1e1e2e;
+    border-radius: 5px;
+    border: 1px solid #353550;
+    padding: 5px;
+"""
+_LAYER_NUM_STYLE = """
+    font-size: 12px;
+    font-weight: bold;
+    color: #00a0ff;
+"""
+_SOUND_NAME_STYLE = """
+    font-size: 14px;
+    color: white;
+"""
+_LAYER_LABEL_STYLE = "color: white;"
+_REMOVE_BTN_STYLE = """
+    background-color: #ff5500;
+    color: white;
+    border-radius: 15px;
+"""
+_TITLE_STYLE = """
+    font-size: 24px;
+    font-weight: bold;
+    color: white;
+"""
+_DESCRIPTION_STYLE = "color: #8080a0;"
+_ADD_LAYER_BTN_STYLE = """
+    background-color: #00a0ff;
+    color: white;
+    border-radius: 5px;
+    padding: 5px 10px;
+"""
+_MIX_BTN_STYLE = """
+    background-color: #00ff99;
+    color: black;
+    border-radius: 5px;
+    padding: 5px 10px;
+    font-weight: bold;
+"""
+_CLEAR_BTN_STYLE = """
+    background-color: #ff5500;
+    color: white;
+    border-radius: 5px;
+    padding: 5px 10px;
+"""
+_LAYERS_SCROLL_STYLE = """
+    background-color: #1a1a2a;
+    border-radius: 10px;
+    border: 1px solid #353550;
+"""
+_OUTPUT_PANEL_STYLE = """
+    background-color: #1e1e2e;
+    border-radius: 10px;
+    border: 1px solid #353550;
+    padding: 10px;
+"""
+_OUTPUT_TITLE_STYLE = """
+    font-size: 16px;
+    font-weight: bold;
+    color: #00a0ff;
+"""
+
+# Effect presets shared by every layer, parameters are read-only
+_FADE_EFFECT = SoundEffect("Fade", "fade", types.MappingProxyType({"fade_in": 0.5, "fade_out": 0.5}))
+_ECHO_EFFECT = SoundEffect("Echo", "echo", types.MappingProxyType({"delay": 0.3, "decay": 0.5}))
+_PITCH_EFFECT = SoundEffect("Pitch", "pitch", types.MappingProxyType({"semitones": 2}))
+_EFFECT_PRESETS = {
+    "None": (),
+    "Fade": (_FADE_EFFECT,),
+    "Echo": (_ECHO_EFFECT,),
+    "Pitch": (_PITCH_EFFECT,),
+}
+
+_mixer_ready = False
+
+def _ensure_mixer_init():
+    """Initialize the pygame mixer once, on first playback"""
+    global _mixer_ready
+    if not _mixer_ready:
+        if not pygame.mixer.get_init():
+            pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=1024)
+        _mixer_ready = True
+
+class CopySignals(QObject):
+    """Signals emitted by a CopyWorker"""
+    
+    done = pyqtSignal(str)  # Destination path
+    failed = pyqtSignal(str)  # Error message
+
+
+class CopyWorker(QRunnable):
+    """Copies a file on the global thread pool so the UI stays responsive"""
+    
+    def __init__(self, source_path, dest_path):
+        super().__init__()
+        self.source_path = source_path
+        self.dest_path = dest_path
+        self.signals = CopySignals()
+        
+    def run(self):
+        try:
+            shutil.copy2(self.source_path, self.dest_path)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.done.emit(self.dest_path)
+
+
+class MixWorker(QObject):
+    """Runs a SoundMixer mix on a worker thread
+    
+    Results are reported through the mixer's own mix_completed/mix_failed
+    signals; finished only marks the end of the run.
+    """
+    
+    finished = pyqtSignal()
+    
+    def __init__(self, sound_mixer, sound_files, volumes, output_path, effects):
+        super().__init__()
+        self.sound_mixer = sound_mixer
+        self.sound_files = sound_files
+        self.volumes = volumes
+        self.output_path = output_path
+        self.effects = effects
+        
+    def run(self):
+        try:
+            self.sound_mixer.create_layered_sound(
+                sound_files=self.sound_files,
+                volumes=self.volumes,
+                output_path=self.output_path,
+                effects=self.effects
+            )
+        finally:
+            self.finished.emit()
+
+
 class SoundLayerItem(QFrame):
     """Widget for a single sound layer in the mixer"""
     
@@ -18,6 +160,14 @@ class SoundLayerItem(QFrame):
     layer_changed = pyqtSignal(int)  # Layer index
     layer_removed = pyqtSignal(int)  # Layer index
     
+    __slots__ = (
+        "layer_index", "sound_file", "volume", "sounds_dir", "effects",
+        "_sound_path", "_display_name", "_sound", "_volume_timer", "layout", "title_layout",
+        "layer_number", "sound_name", "volume_layout", "volume_label",
+        "volume_slider", "effects_layout", "effects_label", "effects_combo",
+        "button_layout", "play_button", "remove_button"
+    )
+    
     def __init__(self, layer_index, sound_file, volume=100, parent=None, sounds_dir="assets/sounds"):
         super().__init__(parent)
         self.layer_index = layer_index
@@ -25,6 +175,15 @@ class SoundLayerItem(QFrame):
         self.volume = volume
         self.sounds_dir = sounds_dir
         self.effects = []
+        self._sound_path = str(pathlib.Path(sounds_dir) / sound_file)
+        self._display_name = sound_file if os.sep not in sound_file else os.path.basename(sound_file)
+        self._sound = None  # Decoded on first playback
+        
+        # Coalesce volume slider drags into one layer_changed emission
+        self._volume_timer = QTimer(self)
+        self._volume_timer.setSingleShot(True)
+        self._volume_timer.setInterval(75)
+        self._volume_timer.timeout.connect(self.emit_layer_changed)
         
         # Set up the UI
         self.setup_ui()
@@ -32,40 +191,33 @@ class SoundLayerItem(QFrame):
     def setup_ui(self):
         """Set up the widget UI"""
         self.setFrameShape(QFrame.StyledPanel)
-        self.setStyleSheet("""
-            background-color: #1e1e2e;
-            border-radius: 5px;
-            border: 1px solid #353550;
-            padding: 5px;
-        """)
+        self.setStyleSheet(_LAYER_FRAME_STYLE)
         
         # Main layout
         self.layout = QHBoxLayout(self)
+        self.layout.setContentsMargins(5, 5, 5, 5)
         
         # Layer number and name
         self.title_layout = QVBoxLayout()
+        self.title_layout.setContentsMargins(0, 0, 0, 0)
+        self.title_layout.setSpacing(2)
         
         self.layer_number = QLabel(f"Layer {self.layer_index + 1}")
-        self.layer_number.setStyleSheet("""
-            font-size: 12px;
-            font-weight: bold;
-            color: #00a0ff;
-        """)
-        
-        self.sound_name = QLabel(os.path.basename(self.sound_file))
-        self.sound_name.setStyleSheet("""
-            font-size: 14px;
-            color: white;
-        """)
+        self.layer_number.setStyleSheet(_LAYER_NUM_STYLE)
+        
+        self.sound_name = QLabel(self._display_name)
+        self.sound_name.setStyleSheet(_SOUND_NAME_STYLE)
         
         self.title_layout.addWidget(self.layer_number)
         self.title_layout.addWidget(self.sound_name)
         
         # Volume control
         self.volume_layout = QVBoxLayout()
+        self.volume_layout.setContentsMargins(0, 0, 0, 0)
+        self.volume_layout.setSpacing(2)
         
         self.volume_label = QLabel("Volume:")
-        self.volume_label.setStyleSheet("color: white;")
+        self.volume_label.setStyleSheet(_LAYER_LABEL_STYLE)
         
         self.volume_slider = QSlider(Qt.Horizontal)
         self.volume_slider.setRange(0, 100)
@@ -77,9 +229,11 @@ class SoundLayerItem(QFrame):
         
         # Effects
         self.effects_layout = QVBoxLayout()
+        self.effects_layout.setContentsMargins(0, 0, 0, 0)
+        self.effects_layout.setSpacing(2)
         
         self.effects_label = QLabel("Effects:")
-        self.effects_label.setStyleSheet("color: white;")
+        self.effects_label.setStyleSheet(_LAYER_LABEL_STYLE)
         
         self.effects_combo = QComboBox()
         self.effects_combo.addItems(["None", "Fade", "Echo", "Pitch"])
@@ -90,6 +244,8 @@ class SoundLayerItem(QFrame):
         
         # Buttons
         self.button_layout = QVBoxLayout()
+        self.button_layout.setContentsMargins(0, 0, 0, 0)
+        self.button_layout.setSpacing(2)
         
         self.play_button = QPushButton("▶")
         self.play_button.setFixedSize(30, 30)
@@ -98,11 +254,7 @@ class SoundLayerItem(QFrame):
         self.remove_button = QPushButton("✕")
         self.remove_button.setFixedSize(30, 30)
         self.remove_button.clicked.connect(self.remove_layer)
-        self.remove_button.setStyleSheet("""
-            background-color: #ff5500;
-            color: white;
-            border-radius: 15px;
-        """)
+        self.remove_button.setStyleSheet(_REMOVE_BTN_STYLE)
         
         self.button_layout.addWidget(self.play_button)
         self.button_layout.addWidget(self.remove_button)
@@ -116,35 +268,34 @@ class SoundLayerItem(QFrame):
     def on_volume_changed(self, value):
         """Handle volume slider change"""
         self.volume = value
+        if self._sound is not None:
+            self._sound.set_volume(value / 100)
+        self._volume_timer.start()
+        
+    def emit_layer_changed(self):
+        """Notify listeners that this layer's parameters changed"""
         self.layer_changed.emit(self.layer_index)
         
     def on_effect_selected(self, index):
         """Handle effect selection"""
         effect_type = self.effects_combo.currentText()
-        
-        if effect_type == "None":
-            self.effects = []
-        elif effect_type == "Fade":
-            self.effects = [SoundEffect("Fade", "fade", {"fade_in": 0.5, "fade_out": 0.5})]
-        elif effect_type == "Echo":
-            self.effects = [SoundEffect("Echo", "echo", {"delay": 0.3, "decay": 0.5})]
-        elif effect_type == "Pitch":
-            self.effects = [SoundEffect("Pitch", "pitch", {"semitones": 2})]
+        self.effects = list(_EFFECT_PRESETS.get(effect_type, ()))
             
         self.layer_changed.emit(self.layer_index)
         
     def play_sound(self):
         """Play just this sound layer"""
         try:
-            import pygame
-            if not pygame.mixer.get_init():
-                pygame.mixer.init()
+            _ensure_mixer_init()
+            
+            # Decode once, later clicks replay the cached sound
+            if self._sound is None:
+                if not os.path.exists(self._sound_path):
+                    return
+                self._sound = pygame.mixer.Sound(self._sound_path)
                 
-            sound_path = os.path.join(self.sounds_dir, self.sound_file)
-            if os.path.exists(sound_path):
-                pygame.mixer.music.load(sound_path)
-                pygame.mixer.music.set_volume(self.volume / 100)
-                pygame.mixer.music.play()
+            self._sound.set_volume(self.volume / 100)
+            self._sound.play()
         except Exception as e:
             print(f"Error playing sound: {e}")
             
@@ -169,8 +320,13 @@ class SoundMixerUI(QWidget):
     def __init__(self, sounds_dir="assets/sounds", parent=None):
         super().__init__(parent)
         self.sounds_dir = sounds_dir
+        self._sounds_path = pathlib.Path(sounds_dir)
+        self._cached_output_path = None
+        self._mixed_sound = None
         self.layers = []
         self.sound_mixer = SoundMixer(sounds_dir)
+        self._mix_thread = None
+        self._mix_worker = None
         
         # Set up the UI
         self.setup_ui()
@@ -182,16 +338,12 @@ class SoundMixerUI(QWidget):
         
         # Title and description
         self.title = QLabel("Sound Mixer")
-        self.title.setStyleSheet("""
-            font-size: 24px;
-            font-weight: bold;
-            color: white;
-        """)
+        self.title.setStyleSheet(_TITLE_STYLE)
         
         self.description = QLabel(
             "Create custom bell sounds by layering multiple sounds and applying effects."
         )
-        self.description.setStyleSheet("color: #8080a0;")
+        self.description.setStyleSheet(_DESCRIPTION_STYLE)
         self.description.setWordWrap(True)
         
         # Buttons
@@ -199,45 +351,31 @@ class SoundMixerUI(QWidget):
         
         self.add_layer_button = QPushButton("+ Add Sound Layer")
         self.add_layer_button.clicked.connect(self.add_layer)
-        self.add_layer_button.setStyleSheet("""
-            background-color: #00a0ff;
-            color: white;
-            border-radius: 5px;
-            padding: 5px 10px;
-        """)
+        self.add_layer_button.setStyleSheet(_ADD_LAYER_BTN_STYLE)
         
         self.mix_button = QPushButton("Mix Sounds")
         self.mix_button.clicked.connect(self.mix_sounds)
-        self.mix_button.setStyleSheet("""
-            background-color: #00ff99;
-            color: black;
-            border-radius: 5px;
-            padding: 5px 10px;
-            font-weight: bold;
-        """)
+        self.mix_button.setStyleSheet(_MIX_BTN_STYLE)
         self.mix_button.setEnabled(False)
         
         self.clear_button = QPushButton("Clear All")
         self.clear_button.clicked.connect(self.clear_layers)
-        self.clear_button.setStyleSheet("""
-            background-color: #ff5500;
-            color: white;
-            border-radius: 5px;
-            padding: 5px 10px;
-        """)
+        self.clear_button.setStyleSheet(_CLEAR_BTN_STYLE)
         
         self.button_layout.addWidget(self.add_layer_button)
         self.button_layout.addWidget(self.mix_button)
         self.button_layout.addWidget(self.clear_button)
         
+        # Busy indicator shown while a mix runs
+        self.mix_progress = QProgressBar()
+        self.mix_progress.setRange(0, 0)
+        self.mix_progress.setTextVisible(False)
+        self.mix_progress.hide()
+        
         # Layers container
         self.layers_scroll = QScrollArea()
         self.layers_scroll.setWidgetResizable(True)
-        self.layers_scroll.setStyleSheet("""
-            background-color: #1a1a2a;
-            border-radius: 10px;
-            border: 1px solid #353550;
-        """)
+        self.layers_scroll.setStyleSheet(_LAYERS_SCROLL_STYLE)
         
         self.layers_container = QWidget()
         self.layers_layout = QVBoxLayout(self.layers_container)
@@ -250,23 +388,15 @@ class SoundMixerUI(QWidget):
         # Output panel
         self.output_panel = QFrame()
         self.output_panel.setFrameShape(QFrame.StyledPanel)
-        self.output_panel.setStyleSheet("""
-            background-color: #1e1e2e;
-            border-radius: 10px;
-            border: 1px solid #353550;
-            padding: 10px;
-        """)
+        self.output_panel.setStyleSheet(_OUTPUT_PANEL_STYLE)
         
         self.output_layout = QVBoxLayout(self.output_panel)
         
         self.output_title = QLabel("Output Sound")
-        self.output_title.setStyleSheet("""
-            font-size: 16px;
-            font-weight: bold;
-            color: #00a0ff;
-        """)
+        self.output_title.setStyleSheet(_OUTPUT_TITLE_STYLE)
         
         self.output_name = QLineEdit("mixed_sound.wav")
+        self.output_name.textChanged.connect(self._invalidate_output_cache)
         
         self.output_play_button = QPushButton("Play Mixed Sound")
         self.output_play_button.clicked.connect(self.play_mixed_sound)
@@ -285,6 +415,7 @@ class SoundMixerUI(QWidget):
         self.layout.addWidget(self.title)
         self.layout.addWidget(self.description)
         self.layout.addLayout(self.button_layout)
+        self.layout.addWidget(self.mix_progress)
         self.layout.addWidget(self.layers_scroll)
         self.layout.addWidget(self.output_panel)
         
@@ -294,122 +425,156 @@ class SoundMixerUI(QWidget):
         
     def add_layer(self):
         """Add a new sound layer"""
-        # Show file dialog to select sound
-        dialog = QFileDialog()
-        dialog.setFileMode(QFileDialog.ExistingFile)
-        dialog.setNameFilter("Sound Files (*.wav *.mp3)")
-        dialog.setDirectory(self.sounds_dir)
-        
-        if dialog.exec_():
-            sound_file = dialog.selectedFiles()[0]
+        # Show the native file dialog to select sound
+        sound_file, _ = QFileDialog.getOpenFileName(
+            self, "Select Sound", self.sounds_dir, "Sound Files (*.wav *.mp3)"
+        )
+        
+        if not sound_file:
+            return
             
-            # Check if it's in the sounds directory
-            if os.path.dirname(sound_file) != self.sounds_dir:
-                # Copy to sounds directory
-                import shutil
-                base_name = os.path.basename(sound_file)
-                dest_path = os.path.join(self.sounds_dir, base_name)
+        # Check if it's in the sounds directory
+        if os.path.dirname(sound_file) != self.sounds_dir:
+            # Copy to sounds directory
+            base_name = os.path.basename(sound_file)
+            dest_path = os.path.join(self.sounds_dir, base_name)
+            
+            # Check if already exists
+            if os.path.exists(dest_path):
+                result = QMessageBox.question(
+                    self, "File Exists",
+                    f"File {base_name} already exists in sounds directory. Use existing file?",
+                    QMessageBox.Yes | QMessageBox.No
+                )
                 
-                # Check if already exists
-                if os.path.exists(dest_path):
-                    result = QMessageBox.question(
-                        self, "File Exists",
-                        f"File {base_name} already exists in sounds directory. Use existing file?",
-                        QMessageBox.Yes | QMessageBox.No
-                    )
-                    
-                    if result == QMessageBox.Yes:
-                        sound_file = base_name
-                    else:
-                        return
-                else:
-                    # Copy file
-                    shutil.copy2(sound_file, dest_path)
+                if result == QMessageBox.Yes:
                     sound_file = base_name
+                else:
+                    return
             else:
-                # Use relative path
-                sound_file = os.path.basename(sound_file)
-                
-            # Add layer widget
-            layer_widget = SoundLayerItem(
-                len(self.layers),
-                sound_file,
-                parent=self,
-                sounds_dir=self.sounds_dir
-            )
-            layer_widget.layer_changed.connect(self.on_layer_changed)
-            layer_widget.layer_removed.connect(self.on_layer_removed)
-            
-            self.layers_layout.addWidget(layer_widget)
-            self.layers.append(layer_widget)
+                # Copy file in the background, the layer is added once it lands
+                self.add_layer_button.setEnabled(False)
+                worker = CopyWorker(sound_file, dest_path)
+                worker.signals.done.connect(self.on_layer_copied)
+                worker.signals.failed.connect(self.on_layer_copy_failed)
+                QThreadPool.globalInstance().start(worker)
+                return
+        else:
+            # Use relative path
+            sound_file = os.path.basename(sound_file)
             
-            # Enable mix button if there's at least one layer
-            self.mix_button.setEnabled(True)
-            
-    def on_layer_changed(self, layer_index):
-        """Handle layer parameter changes"""
-        # Nothing to do here, data is stored in the layer widget
-        pass
+        self.add_layer_widget(sound_file)
+        
+    def on_layer_copied(self, dest_path):
+        """Add the layer for a sound file copied into the sounds directory"""
+        self.add_layer_button.setEnabled(True)
+        self.add_layer_widget(os.path.basename(dest_path))
+        
+    def on_layer_copy_failed(self, error_message):
+        """Handle a failed copy into the sounds directory"""
+        self.add_layer_button.setEnabled(True)
+        QMessageBox.warning(self, "Copy Error", f"Error copying sound: {error_message}")
+        
+    def add_layer_widget(self, sound_file):
+        """Create the layer widget for a sound in the sounds directory"""
+        layer_widget = SoundLayerItem(
+            len(self.layers),
+            sound_file,
+            parent=self,
+            sounds_dir=self.sounds_dir
+        )
+        layer_widget.layer_removed.connect(self.on_layer_removed)
         
+        self.layers_layout.addWidget(layer_widget)
+        self.layers.append(layer_widget)
+        
+        # Enable mix button if there's at least one layer
+        self.mix_button.setEnabled(True)
+            
     def on_layer_removed(self, layer_index):
         """Handle layer removal"""
-        # Get the widget to remove
-        widget_to_remove = None
-        for i, layer in enumerate(self.layers):
-            if layer.layer_index == layer_index:
-                widget_to_remove = layer
-                break
-                
-        if not widget_to_remove:
+        # Layer indices always match list positions
+        if not 0 <= layer_index < len(self.layers):
             return
             
         # Remove from layout and list
+        widget_to_remove = self.layers.pop(layer_index)
+        assert widget_to_remove.layer_index == layer_index, "layer index out of sync with its list position"
         self.layers_layout.removeWidget(widget_to_remove)
-        self.layers.remove(widget_to_remove)
         widget_to_remove.deleteLater()
         
-        # Renumber remaining layers
-        for i, layer in enumerate(self.layers):
+        # Renumber the layers after the removed one in a single repaint
+        self.layers_container.setUpdatesEnabled(False)
+        for i in range(layer_index, len(self.layers)):
+            layer = self.layers[i]
             layer.layer_index = i
             layer.layer_number.setText(f"Layer {i + 1}")
+        self.layers_container.setUpdatesEnabled(True)
             
         # Disable mix button if no layers left
         if not self.layers:
             self.mix_button.setEnabled(False)
             
+    def _invalidate_output_cache(self):
+        """Forget the resolved output path after the output name is edited"""
+        self._cached_output_path = None
+        self._mixed_sound = None
+        
+    def _resolve_output_path(self):
+        """Return the mixed sound path for the current output name"""
+        if self._cached_output_path is None:
+            output_name = self.output_name.text()
+            if not output_name.endswith(('.wav', '.mp3')):
+                output_name += '.wav'
+                
+            self._cached_output_path = str(self._sounds_path / output_name)
+            
+        return self._cached_output_path
+        
     def mix_sounds(self):
         """Mix the sound layers"""
-        if not self.layers:
+        if not self.layers or self._mix_thread is not None:
             return
             
         # Get data from each layer
-        sound_files = []
-        volumes = []
-        all_effects = []
-        
-        for layer in self.layers:
-            data = layer.get_data()
-            sound_files.append(data["sound_file"])
-            volumes.append(data["volume"])
-            all_effects.extend(data["effects"])
+        data = [layer.get_data() for layer in self.layers]
+        sound_files = [d["sound_file"] for d in data]
+        volumes = np.fromiter((d["volume"] for d in data), dtype=np.float32, count=len(data))
+        all_effects = list(itertools.chain.from_iterable(d["effects"] for d in data))
             
-        # Get output name
-        output_name = self.output_name.text()
-        if not output_name.endswith(('.wav', '.mp3')):
-            output_name += '.wav'
-            
-        output_path = os.path.join(self.sounds_dir, output_name)
-        
-        # Perform the mix
-        self.sound_mixer.create_layered_sound(
-            sound_files=sound_files,
-            volumes=volumes,
-            output_path=output_path,
-            effects=all_effects
+        output_path = self._resolve_output_path()
+        
+        # Perform the mix on a worker thread
+        self.mix_button.setEnabled(False)
+        self.mix_progress.show()
+        
+        self._mix_thread = QThread(self)
+        self._mix_worker = MixWorker(
+            self.sound_mixer,
+            sound_files,
+            volumes,
+            output_path,
+            all_effects
         )
+        self._mix_worker.moveToThread(self._mix_thread)
+        self._mix_thread.started.connect(self._mix_worker.run)
+        self._mix_worker.finished.connect(self._mix_thread.quit)
+        self._mix_worker.finished.connect(self._mix_worker.deleteLater)
+        self._mix_thread.finished.connect(self.on_mix_thread_finished)
+        self._mix_thread.start()
+        
+    def on_mix_thread_finished(self):
+        """Clean up after the mix worker thread exits"""
+        self._mix_thread.deleteLater()
+        self._mix_thread = None
+        self._mix_worker = None
+        
+        self.mix_progress.hide()
+        self.mix_button.setEnabled(bool(self.layers))
         
     def on_mix_completed(self, output_path):
         """Handle successful mix"""
+        self._mixed_sound = None
         self.output_play_button.setEnabled(True)
         self.output_save_button.setEnabled(True)
         
@@ -425,11 +590,7 @@ class SoundMixerUI(QWidget):
         
     def play_mixed_sound(self):
         """Play the mixed sound"""
-        output_name = self.output_name.text()
-        if not output_name.endswith(('.wav', '.mp3')):
-            output_name += '.wav'
-            
-        output_path = os.path.join(self.sounds_dir, output_name)
+        output_path = self._resolve_output_path()
         
         if not os.path.exists(output_path):
             QMessageBox.warning(self, "File Not Found", 
@@ -437,22 +598,20 @@ class SoundMixerUI(QWidget):
             return
             
         try:
-            import pygame
-            if not pygame.mixer.get_init():
-                pygame.mixer.init()
+            _ensure_mixer_init()
+            
+            # Decode once per mix, later clicks replay the cached sound
+            if self._mixed_sound is None:
+                self._mixed_sound = pygame.mixer.Sound(output_path)
                 
-            pygame.mixer.music.load(output_path)
-            pygame.mixer.music.play()
+            self._mixed_sound.play()
         except Exception as e:
             QMessageBox.warning(self, "Playback Error", f"Error playing sound: {str(e)}")
             
     def save_mixed_sound(self):
         """Save the mixed sound to a different location"""
-        output_name = self.output_name.text()
-        if not output_name.endswith(('.wav', '.mp3')):
-            output_name += '.wav'
-            
-        source_path = os.path.join(self.sounds_dir, output_name)
+        source_path = self._resolve_output_path()
+        output_name = os.path.basename(source_path)
         
         if not os.path.exists(source_path):
             QMessageBox.warning(self, "File Not Found", 
@@ -467,14 +626,23 @@ class SoundMixerUI(QWidget):
         if not file_path:
             return
             
-        try:
-            import shutil
-            shutil.copy2(source_path, file_path)
-            
-            QMessageBox.information(self, "Save Complete", 
-                                   f"Sound saved to {file_path}")
-        except Exception as e:
-            QMessageBox.warning(self, "Save Error", f"Error saving sound: {str(e)}")
+        # Copy in the background
+        self.output_save_button.setEnabled(False)
+        worker = CopyWorker(source_path, file_path)
+        worker.signals.done.connect(self.on_save_completed)
+        worker.signals.failed.connect(self.on_save_failed)
+        QThreadPool.globalInstance().start(worker)
+        
+    def on_save_completed(self, file_path):
+        """Handle a finished save copy"""
+        self.output_save_button.setEnabled(True)
+        QMessageBox.information(self, "Save Complete", 
+                               f"Sound saved to {file_path}")
+        
+    def on_save_failed(self, error_message):
+        """Handle a failed save copy"""
+        self.output_save_button.setEnabled(True)
+        QMessageBox.warning(self, "Save Error", f"Error saving sound: {error_message}")
             
     def clear_layers(self):
         """Remove all layers"""
@@ -491,10 +659,14 @@ class SoundMixerUI(QWidget):
         if result != QMessageBox.Yes:
             return
             
-        # Remove all layers
-        for layer in self.layers:
-            self.layers_layout.removeWidget(layer)
-            layer.deleteLater()
+        # Remove all layers in a single repaint
+        self.layers_container.setUpdatesEnabled(False)
+        while self.layers_layout.count():
+            item = self.layers_layout.takeAt(0)
+            if item.widget() is not None:
+                item.widget().deleteLater()
+        self.layers_container.setUpdatesEnabled(True)
+        self.layers_container.update()
             
         self.layers = []
         
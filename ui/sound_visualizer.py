@@ -1,176 +1,217 @@
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame,
     QScrollArea, QSlider, QFileDialog, QComboBox, QMessageBox,
-    QListWidget, QListWidgetItem, QMenu, QSpinBox, QCheckBox,
-    QGroupBox, QFormLayout, QTabWidget, QSplitter
+    QMenu, QSpinBox, QCheckBox,
+    QGroupBox, QFormLayout, QTabWidget, QSplitter, QListView,
+    QAbstractItemView
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QStringListModel, QObject, QRunnable, QThreadPool
 from PyQt5.QtGui import QPixmap, QFont, QColor, QPainter
 
 import os
-import numpy as np
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
 import wave
 import contextlib
+import collections
 
-class WaveformCanvas(FigureCanvas):
-    """Canvas for displaying audio waveform"""
+# Number of decoded sounds kept in memory
+AUDIO_CACHE_SIZE = 8
+
+# Frames read from a WAV file per chunk while decoding
+DECODE_CHUNK_FRAMES = 16384
+
+# File extensions listed as sounds
+SOUND_EXTENSIONS = frozenset({'.wav', '.mp3'})
+
+# WAV sample width in bytes -> numpy dtype of one sample
+_WAV_DTYPES = {1: 'u1', 2: '<i2', 4: '<i4'}
+
+# Min/max bins stored in a sound's envelope sidecar (<sound>.env.npz)
+ENVELOPE_SIDECAR_BINS = 4096
+
+
+def _read_soundfile(path):
+    """Decode with libsndfile straight to float32 and downmix to mono"""
+    import soundfile as sf
     
-    def __init__(self, parent=None, width=5, height=4, dpi=100):
-        self.fig = Figure(figsize=(width, height), dpi=dpi)
-        self.fig.patch.set_facecolor('#1e1e2e')
-        
-        self.axes = self.fig.add_subplot(111)
-        self.axes.set_facecolor('#1e1e2e')
-        self.axes.tick_params(axis='x', colors='white')
-        self.axes.tick_params(axis='y', colors='white')
-        self.axes.spines['bottom'].set_color('#353550')
-        self.axes.spines['top'].set_color('#353550')
-        self.axes.spines['left'].set_color('#353550')
-        self.axes.spines['right'].set_color('#353550')
-        self.axes.set_title('Waveform', color='white')
-        self.axes.set_xlabel('Time (s)', color='white')
-        self.axes.set_ylabel('Amplitude', color='white')
-        
-        super().__init__(self.fig)
-        self.setParent(parent)
-        
-        self.setStyleSheet("background-color: #1e1e2e;")
-        
-    def plot_waveform(self, audio_path):
-        """Plot audio waveform from file"""
-        self.axes.clear()
-        
-        try:
-            # Read audio file
-            with contextlib.closing(wave.open(audio_path, 'rb')) as wf:
-                # Get parameters
-                num_channels = wf.getnchannels()
-                sample_width = wf.getsampwidth()
-                sample_rate = wf.getframerate()
-                num_frames = wf.getnframes()
-                
-                # Read all frames
-                buffer = wf.readframes(num_frames)
-                
-                # Convert buffer to numpy array
-                if sample_width == 1:
-                    dtype = np.uint8
-                elif sample_width == 2:
-                    dtype = np.int16
-                elif sample_width == 4:
-                    dtype = np.int32
-                else:
-                    raise ValueError(f"Unsupported sample width: {sample_width}")
-                    
-                # Convert to numpy array
-                samples = np.frombuffer(buffer, dtype=dtype)
-                
-                # If stereo, take just left channel
-                if num_channels == 2:
-                    samples = samples[::2]
-                    
-                # Create time axis
-                duration = num_frames / sample_rate
-                time = np.linspace(0, duration, num=len(samples))
-                
-                # Plot waveform
-                self.axes.plot(time, samples, color='#00a0ff')
-                self.axes.set_xlim(0, duration)
-                
-                # Set titles
-                self.axes.set_title('Waveform', color='white')
-                self.axes.set_xlabel('Time (s)', color='white')
-                self.axes.set_ylabel('Amplitude', color='white')
-                
-                self.fig.tight_layout()
-                self.draw()
-                return True
+    data, sample_rate = sf.read(path, dtype='float32', always_2d=True)
+    return data.mean(axis=1), sample_rate
+
+
+def _read_audioread(path):
+    """Decode formats libsndfile can't read (e.g. MP3) through audioread"""
+    import numpy as np
+    import audioread
+    
+    with audioread.audio_open(path) as f:
+        sample_rate = f.samplerate
+        num_channels = f.channels
+        pcm = b"".join(f)
+        
+    # audioread yields interleaved 16-bit little-endian PCM
+    data = np.frombuffer(pcm, dtype='<i2').reshape(-1, num_channels)
+    samples = data.mean(axis=1, dtype=np.float32) / np.float32(32768)
+    return samples, sample_rate
+
+
+def _read_wave(path):
+    """Decode a PCM WAV file with the standard library wave module"""
+    import numpy as np
+    
+    with contextlib.closing(wave.open(path, 'rb')) as wf:
+        # Get parameters
+        num_channels = wf.getnchannels()
+        sample_width = wf.getsampwidth()
+        sample_rate = wf.getframerate()
+        num_frames = wf.getnframes()
+        
+        dtype = _WAV_DTYPES.get(sample_width)
+        if dtype is None:
+            raise ValueError(f"Unsupported sample width: {sample_width}")
+            
+        # Scale to [-1, 1] like the soundfile path (8-bit WAV is unsigned)
+        full_scale = float(2 ** (8 * sample_width - 1))
+        offset = full_scale if sample_width == 1 else 0.0
+        
+        # Read in chunks, downmixing each one straight into a contiguous float32
+        # buffer so the full interleaved data is never held in memory
+        samples = np.empty(num_frames, dtype=np.float32)
+        pos = 0
+        while pos < num_frames:
+            buffer = wf.readframes(min(num_frames - pos, DECODE_CHUNK_FRAMES))
+            if not buffer:
+                break
+            chunk = np.frombuffer(buffer, dtype=dtype).reshape(-1, num_channels)
+            np.mean(chunk, axis=1, dtype=np.float32, out=samples[pos:pos + len(chunk)])
+            pos += len(chunk)
+            
+        samples = samples[:pos]
+        samples -= offset
+        samples /= full_scale
         
-        except Exception as e:
-            print(f"Error plotting waveform: {e}")
-            return False
+    return samples, sample_rate
+
+
+def _decode_file(path):
+    """Decode a sound file to (mono samples, sample rate)"""
+    try:
+        return _read_soundfile(path)
+    except (ImportError, OSError, RuntimeError):
+        # soundfile/libsndfile missing, or a libsndfile build without MP3 support
+        pass
+        
+    if path.lower().endswith('.wav'):
+        return _read_wave(path)
+    return _read_audioread(path)
+
+
+def _sidecar_path(path):
+    """Envelope sidecar file stored next to a sound"""
+    return path + '.env.npz'
+
+
+def _source_stamp(path):
+    """(mtime_ns, size) identifying the exact version of a sound file"""
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def _load_envelope_sidecar(path, stamp):
+    """Waveform points from a sound's envelope sidecar, or None if missing or stale"""
+    import numpy as np
+    
+    try:
+        with np.load(_sidecar_path(path), mmap_mode='r') as data:
+            # copy2 keeps the source mtime, so only an exact match is fresh
+            if (int(data["mtime_ns"]), int(data["size"])) != stamp:
+                return None
+            env_min = data["mn"]
+            env_max = data["mx"]
+            duration = float(data["dur"])
+    except (OSError, ValueError, KeyError):
+        return None
+        
+    points = np.empty(2 * len(env_min), dtype=np.float32)
+    points[0::2] = env_min
+    points[1::2] = env_max
+    time = np.linspace(0, duration, num=len(points))
+    return time, points
+
+
+def _save_envelope_sidecar(path, stamp, samples, sample_rate):
+    """Store a fixed-size min/max envelope next to a long sound, tagged with its stamp"""
+    bins = ENVELOPE_SIDECAR_BINS
+    if len(samples) <= 2 * bins:
+        return
+        
+    import numpy as np
+    from ui._audio_kernels import reduce_envelope
+    
+    env_min = np.empty(bins, dtype=np.float32)
+    env_max = np.empty(bins, dtype=np.float32)
+    reduce_envelope(samples, bins, env_min, env_max)
+    
+    try:
+        np.savez(_sidecar_path(path), mn=env_min, mx=env_max,
+                 sr=sample_rate, dur=len(samples) / sample_rate,
+                 mtime_ns=stamp[0], size=stamp[1])
+    except OSError:
+        # Read-only sounds directory; the envelope is simply recomputed next time
+        pass
 
 
-class SpectrogramCanvas(FigureCanvas):
-    """Canvas for displaying audio spectrogram"""
+class AudioJobSignals(QObject):
+    """Signals emitted by an AudioJob"""
     
-    def __init__(self, parent=None, width=5, height=4, dpi=100):
-        self.fig = Figure(figsize=(width, height), dpi=dpi)
-        self.fig.patch.set_facecolor('#1e1e2e')
-        
-        self.axes = self.fig.add_subplot(111)
-        self.axes.set_facecolor('#1e1e2e')
-        self.axes.tick_params(axis='x', colors='white')
-        self.axes.tick_params(axis='y', colors='white')
-        self.axes.spines['bottom'].set_color('#353550')
-        self.axes.spines['top'].set_color('#353550')
-        self.axes.spines['left'].set_color('#353550')
-        self.axes.spines['right'].set_color('#353550')
-        self.axes.set_title('Spectrogram', color='white')
-        self.axes.set_xlabel('Time (s)', color='white')
-        self.axes.set_ylabel('Frequency (Hz)', color='white')
-        
-        super().__init__(self.fig)
-        self.setParent(parent)
-        
-        self.setStyleSheet("background-color: #1e1e2e;")
-        
-    def plot_spectrogram(self, audio_path):
-        """Plot audio spectrogram from file"""
-        self.axes.clear()
+    decoded = pyqtSignal(object, object)  # Cache key, decoded audio
+    waveform_ready = pyqtSignal(str, object, object)  # Path, time axis, points
+    spectrogram_ready = pyqtSignal(str, object, object)  # Path, Pxx, extent
+    failed = pyqtSignal(str, int, str)  # Path, tab index, error message
+
+
+class AudioJob(QRunnable):
+    """Decodes a sound and computes one visualization on the global thread pool"""
+    
+    def __init__(self, path, key, audio, index, target):
+        super().__init__()
+        self.path = path
+        self.key = key
+        self.audio = audio  # Cached decode, or None to decode here
+        self.index = index  # 0 = waveform, 1 = spectrogram
+        self.target = target  # Waveform envelope bins
+        self.signals = AudioJobSignals()
+        
+    def run(self):
+        from ui.visualizer_canvas import compute_waveform, compute_spectrogram
         
         try:
-            # Read audio file
-            with contextlib.closing(wave.open(audio_path, 'rb')) as wf:
-                # Get parameters
-                num_channels = wf.getnchannels()
-                sample_width = wf.getsampwidth()
-                sample_rate = wf.getframerate()
-                num_frames = wf.getnframes()
-                
-                # Read all frames
-                buffer = wf.readframes(num_frames)
-                
-                # Convert buffer to numpy array
-                if sample_width == 1:
-                    dtype = np.uint8
-                elif sample_width == 2:
-                    dtype = np.int16
-                elif sample_width == 4:
-                    dtype = np.int32
-                else:
-                    raise ValueError(f"Unsupported sample width: {sample_width}")
-                    
-                # Convert to numpy array
-                samples = np.frombuffer(buffer, dtype=dtype)
-                
-                # If stereo, take just left channel
-                if num_channels == 2:
-                    samples = samples[::2]
+            audio = self.audio
+            if audio is None and self.index == 0:
+                # A fresh envelope sidecar skips decoding entirely
+                sidecar = _load_envelope_sidecar(self.path, self.key[1:])
+                if sidecar is not None:
+                    self.signals.waveform_ready.emit(self.path, *sidecar)
+                    return
                     
-                # Plot spectrogram
-                self.axes.specgram(samples, Fs=sample_rate, cmap='viridis')
+            if audio is None:
+                samples, sample_rate = _decode_file(self.path)
+                _save_envelope_sidecar(self.path, self.key[1:], samples, sample_rate)
+                audio = {
+                    "samples": samples,
+                    "sample_rate": sample_rate,
+                    "spectrogram": None  # (Pxx, extent), computed on first use
+                }
+                self.signals.decoded.emit(self.key, audio)
                 
-                # Set titles
-                self.axes.set_title('Spectrogram', color='white')
-                self.axes.set_xlabel('Time (s)', color='white')
-                self.axes.set_ylabel('Frequency (Hz)', color='white')
-                
-                # Add colorbar
-                cbar = self.fig.colorbar(self.axes.images[0])
-                cbar.ax.tick_params(labelcolor='white')
-                cbar.set_label('Intensity (dB)', color='white')
+            if self.index == 0:
+                time, points = compute_waveform(audio["samples"], audio["sample_rate"], self.target)
+                self.signals.waveform_ready.emit(self.path, time, points)
+            else:
+                if audio["spectrogram"] is None:
+                    audio["spectrogram"] = compute_spectrogram(audio["samples"], audio["sample_rate"])
+                self.signals.spectrogram_ready.emit(self.path, *audio["spectrogram"])
                 
-                self.fig.tight_layout()
-                self.draw()
-                return True
-        
         except Exception as e:
-            print(f"Error plotting spectrogram: {e}")
-            return False
+            self.signals.failed.emit(self.path, self.index, str(e))
 
 
 class SoundVisualizerWidget(QWidget):
@@ -182,6 +223,17 @@ class SoundVisualizerWidget(QWidget):
         super().__init__(parent)
         self.sounds_dir = sounds_dir
         self.current_sound = None
+        self._audio_cache = collections.OrderedDict()  # (path, mtime_ns, size) -> decoded audio
+        self.pygame_available = None  # Unknown until first playback
+        self._rendered = {}  # path -> indices of tabs already showing it
+        self._pending_sound = None  # File name waiting for the selection debounce
+        self._jobs = set()  # (path, tab index) being computed in the background
+        
+        # Coalesce rapid selection changes (e.g. arrow-keying through the list)
+        self._sel_timer = QTimer(self)
+        self._sel_timer.setSingleShot(True)
+        self._sel_timer.setInterval(150)
+        self._sel_timer.timeout.connect(self._apply_selection)
         
         # Set up the UI
         self.setup_ui()
@@ -248,7 +300,11 @@ class SoundVisualizerWidget(QWidget):
             color: #00a0ff;
         """)
         
-        self.sound_list = QListWidget()
+        # Plain string model: one list update per reload, no per-item objects
+        self._sound_model = QStringListModel(self)
+        self.sound_list = QListView()
+        self.sound_list.setModel(self._sound_model)
+        self.sound_list.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.sound_list.setStyleSheet("""
             background-color: #252535;
             border-radius: 5px;
@@ -256,7 +312,7 @@ class SoundVisualizerWidget(QWidget):
             padding: 5px;
             color: white;
         """)
-        self.sound_list.itemSelectionChanged.connect(self.on_sound_selected)
+        self.sound_list.selectionModel().selectionChanged.connect(self.on_sound_selected)
         self.sound_list.setContextMenuPolicy(Qt.CustomContextMenu)
         self.sound_list.customContextMenuRequested.connect(self.show_context_menu)
         
@@ -340,16 +396,15 @@ class SoundVisualizerWidget(QWidget):
         # Waveform tab
         self.waveform_tab = QWidget()
         self.waveform_layout = QVBoxLayout(self.waveform_tab)
-        self.waveform_canvas = WaveformCanvas(self)
-        self.waveform_layout.addWidget(self.waveform_canvas)
+        self.waveform_canvas = None  # Created when the tab is first shown
         self.viz_tabs.addTab(self.waveform_tab, "Waveform")
         
         # Spectrogram tab
         self.spectrogram_tab = QWidget()
         self.spectrogram_layout = QVBoxLayout(self.spectrogram_tab)
-        self.spectrogram_canvas = SpectrogramCanvas(self)
-        self.spectrogram_layout.addWidget(self.spectrogram_canvas)
+        self.spectrogram_canvas = None  # Created when the tab is first shown
         self.viz_tabs.addTab(self.spectrogram_tab, "Spectrogram")
+        self.viz_tabs.currentChanged.connect(self.on_tab_changed)
         
         # Add elements to visualization panel
         self.viz_layout.addWidget(self.sound_info)
@@ -366,39 +421,76 @@ class SoundVisualizerWidget(QWidget):
         self.layout.addLayout(self.header_layout)
         self.layout.addWidget(self.splitter)
         
-        # Initialize pygame mixer for playback
-        try:
-            import pygame
-            pygame.mixer.init()
-            self.pygame_available = True
-        except ImportError:
-            self.pygame_available = False
-            QMessageBox.warning(self, "Pygame Not Available", 
-                               "Pygame is not available. Sound playback will be disabled.")
+    def showEvent(self, event):
+        """Create the visible tab's canvas the first time the widget is shown"""
+        super().showEvent(event)
+        self._ensure_canvas(self.viz_tabs.currentIndex())
+        
+    def _ensure_canvas(self, index):
+        """Create the canvas for a visualization tab on first use"""
+        if index == 0 and self.waveform_canvas is None:
+            from ui.visualizer_canvas import WaveformCanvas
+            self.waveform_canvas = WaveformCanvas(self)
+            self.waveform_layout.addWidget(self.waveform_canvas)
+            return True
+        if index == 1 and self.spectrogram_canvas is None:
+            from ui.visualizer_canvas import SpectrogramCanvas
+            self.spectrogram_canvas = SpectrogramCanvas(self)
+            self.spectrogram_layout.addWidget(self.spectrogram_canvas)
+            return True
+        return False
+        
+    def on_tab_changed(self, index):
+        """Render the current sound into a newly shown tab"""
+        if self.current_sound:
+            self._render_current_tab(self.current_sound)
+            
+    def _ensure_pygame(self):
+        """Initialize the pygame mixer on first playback"""
+        if self.pygame_available is None:
+            try:
+                import pygame
+                pygame.mixer.init()
+                self.pygame_available = True
+            except ImportError:
+                self.pygame_available = False
+                QMessageBox.warning(self, "Pygame Not Available", 
+                                   "Pygame is not available. Sound playback will be disabled.")
+        return self.pygame_available
         
     def load_sounds(self):
         """Load sound files from the sounds directory"""
-        self.sound_list.clear()
+        self._rendered.clear()
         
         if not os.path.exists(self.sounds_dir):
             os.makedirs(self.sounds_dir, exist_ok=True)
+            self._sound_model.setStringList([])
             return
             
-        sound_files = []
-        for file in os.listdir(self.sounds_dir):
-            if file.lower().endswith(('.wav', '.mp3')):
-                sound_files.append(file)
-                
-        for sound_file in sorted(sound_files):
-            self.sound_list.addItem(sound_file)
+        # Single directory pass, filtering on the cached entry name
+        with os.scandir(self.sounds_dir) as entries:
+            sound_files = sorted(
+                entry.name for entry in entries
+                if os.path.splitext(entry.name)[1].lower() in SOUND_EXTENSIONS
+                and entry.is_file()
+            )
+            
+        # Replace the whole list in one model update
+        self._sound_model.setStringList(sound_files)
             
     def on_sound_selected(self):
         """Handle sound selection from the list"""
-        items = self.sound_list.selectedItems()
-        if not items:
+        index = self.sound_list.currentIndex()
+        if not index.isValid():
+            self._sel_timer.stop()
             return
             
-        sound_file = items[0].text()
+        self._pending_sound = index.data()
+        self._sel_timer.start()
+        
+    def _apply_selection(self):
+        """Show the last selected sound once the selection has settled"""
+        sound_file = self._pending_sound
         sound_path = os.path.join(self.sounds_dir, sound_file)
         
         if not os.path.exists(sound_path):
@@ -423,15 +515,98 @@ class SoundVisualizerWidget(QWidget):
         
     def visualize_sound(self, sound_path):
         """Generate visualizations for the selected sound"""
-        # Plot waveform
-        self.waveform_canvas.plot_waveform(sound_path)
+        # Tabs still showing another sound must be redrawn when next shown
+        if sound_path not in self._rendered:
+            self._rendered = {sound_path: set()}
+            
+        self._render_current_tab(sound_path)
         
-        # Plot spectrogram
-        self.spectrogram_canvas.plot_spectrogram(sound_path)
+    def _render_current_tab(self, sound_path):
+        """Plot the sound into the visible tab only, skipping it if already drawn"""
+        index = self.viz_tabs.currentIndex()
+        rendered = self._rendered.setdefault(sound_path, set())
+        if index in rendered or (sound_path, index) in self._jobs:
+            return
+            
+        self._ensure_canvas(index)
+        
+        try:
+            key = (sound_path,) + _source_stamp(sound_path)
+        except OSError as e:
+            print(f"Error reading sound: {e}")
+            return
+            
+        audio = self._cached_audio(key)
+        
+        # Another tab's job is already decoding this sound; render once it's cached
+        if audio is None and (sound_path, 1 - index) in self._jobs:
+            return
+            
+        # A cached spectrogram is cheap enough to show straight away
+        if index == 1 and audio is not None and audio["spectrogram"] is not None:
+            if self.spectrogram_canvas.plot_spectrogram(*audio["spectrogram"]):
+                rendered.add(index)
+            return
+            
+        # Decode and compute off the GUI thread
+        target = self.waveform_canvas.envelope_target() if index == 0 else 0
+        job = AudioJob(sound_path, key, audio, index, target)
+        job.signals.decoded.connect(self._store_audio)
+        job.signals.waveform_ready.connect(self.on_waveform_ready)
+        job.signals.spectrogram_ready.connect(self.on_spectrogram_ready)
+        job.signals.failed.connect(self.on_audio_job_failed)
+        self._jobs.add((sound_path, index))
+        QThreadPool.globalInstance().start(job)
+        
+    def on_waveform_ready(self, path, time, points):
+        """Draw a computed waveform if its sound is still selected"""
+        self._jobs.discard((path, 0))
+        if path in self._rendered and self.waveform_canvas.show_waveform(time, points):
+            self._rendered[path].add(0)
+            
+        # A sidecar hit never emits decoded, so pick up a tab waiting on it here
+        self._render_pending_tab(path)
+            
+    def on_spectrogram_ready(self, path, Pxx, extent):
+        """Draw a computed spectrogram if its sound is still selected"""
+        self._jobs.discard((path, 1))
+        if path in self._rendered and self.spectrogram_canvas.plot_spectrogram(Pxx, extent):
+            self._rendered[path].add(1)
+            
+    def on_audio_job_failed(self, path, index, message):
+        """Report a sound that could not be decoded or analysed"""
+        self._jobs.discard((path, index))
+        print(f"Error reading sound: {message}")
+        
+        # Retry only a tab that was waiting on this job, not the one that failed
+        if index != self.viz_tabs.currentIndex():
+            self._render_pending_tab(path)
+        
+    def _cached_audio(self, key):
+        """Decoded audio for a (path, mtime_ns, size) key, or None if not cached"""
+        audio = self._audio_cache.get(key)
+        if audio is not None:
+            self._audio_cache.move_to_end(key)
+        return audio
+        
+    def _store_audio(self, key, audio):
+        """Cache decoded audio, evicting the least recently used entry"""
+        self._audio_cache[key] = audio
+        self._audio_cache.move_to_end(key)
+        if len(self._audio_cache) > AUDIO_CACHE_SIZE:
+            self._audio_cache.popitem(last=False)
+            
+        # Pick up a tab that was shown while this sound was still decoding
+        self._render_pending_tab(key[0])
         
+    def _render_pending_tab(self, path):
+        """Render the visible tab if it was shown while path was still loading"""
+        if path == self.current_sound and path in self._rendered:
+            self._render_current_tab(path)
+            
     def play_sound(self):
         """Play the selected sound"""
-        if not self.current_sound or not self.pygame_available:
+        if not self.current_sound or not self._ensure_pygame():
             return
             
         try:
@@ -504,17 +679,19 @@ class SoundVisualizerWidget(QWidget):
                 return
                 
         try:
-            # Copy the file
+            # Drop the replaced sound's envelope, then copy the file
+            if os.path.exists(_sidecar_path(dest_path)):
+                os.remove(_sidecar_path(dest_path))
             shutil.copy2(file_path, dest_path)
             
             # Reload sounds
             self.load_sounds()
             
             # Select the new sound
-            for i in range(self.sound_list.count()):
-                if self.sound_list.item(i).text() == file_name:
-                    self.sound_list.setCurrentRow(i)
-                    break
+            sound_files = self._sound_model.stringList()
+            if file_name in sound_files:
+                row = sound_files.index(file_name)
+                self.sound_list.setCurrentIndex(self._sound_model.index(row))
                     
         except Exception as e:
             QMessageBox.warning(self, "Import Error", f"Error importing sound: {str(e)}")
@@ -548,11 +725,10 @@ class SoundVisualizerWidget(QWidget):
             
         try:
             # Save the figure
-            if current_tab == 0:
-                self.waveform_canvas.fig.savefig(file_path, dpi=300, bbox_inches='tight')
-            else:
-                self.spectrogram_canvas.fig.savefig(file_path, dpi=300, bbox_inches='tight')
-                
+            self._ensure_canvas(current_tab)
+            canvas = self.waveform_canvas if current_tab == 0 else self.spectrogram_canvas
+            canvas.fig.savefig(file_path, dpi=300, bbox_inches='tight')
+            
             QMessageBox.information(self, "Export Complete", 
                                    f"Visualization exported to {file_path}")
                                    
@@ -561,8 +737,7 @@ class SoundVisualizerWidget(QWidget):
             
     def show_context_menu(self, position):
         """Show context menu for sound list"""
-        items = self.sound_list.selectedItems()
-        if not items:
+        if not self.sound_list.currentIndex().isValid():
             return
             
         menu = QMenu()
@@ -584,11 +759,11 @@ class SoundVisualizerWidget(QWidget):
             
     def remove_selected_sound(self):
         """Remove the selected sound file"""
-        items = self.sound_list.selectedItems()
-        if not items:
+        index = self.sound_list.currentIndex()
+        if not index.isValid():
             return
             
-        sound_file = items[0].text()
+        sound_file = index.data()
         sound_path = os.path.join(self.sounds_dir, sound_file)
         
         # Confirm deletion
@@ -605,12 +780,13 @@ class SoundVisualizerWidget(QWidget):
                 self.stop_sound()
                 self.current_sound = None
                 
-            # Delete the file
+            # Delete the file and its envelope sidecar
             os.remove(sound_path)
+            if os.path.exists(_sidecar_path(sound_path)):
+                os.remove(_sidecar_path(sound_path))
             
             # Remove from list
-            row = self.sound_list.row(items[0])
-            self.sound_list.takeItem(row)
+            self._sound_model.removeRows(index.row(), 1)
             
             # Reset UI
             self.sound_info.setText("Select a sound to visualize")
@@ -1,48 +1,62 @@
 from PyQt5.QtWidgets import QSplashScreen, QProgressBar, QLabel, QVBoxLayout, QWidget
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QPixmap, QColor, QPainter, QFont
 
+# Pre-rendered splash image, built by tools/build_splash.py
+SPLASH_PIXMAP_PATH = "assets/splash.png"
+
+
+def paint_splash_pixmap():
+    """Paint the static splash image"""
+    # Create a custom pixmap for the splash screen
+    pixmap = QPixmap(400, 300)
+    pixmap.fill(Qt.transparent)
+    
+    # Create a painter to draw on the pixmap
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    
+    # Draw glassmorphism effect
+    painter.setBrush(QColor(20, 20, 30, 220))
+    painter.setPen(Qt.NoPen)
+    painter.drawRoundedRect(0, 0, 400, 300, 15, 15)
+    
+    # Draw logo/text
+    painter.setPen(QColor(0, 200, 255))
+    font = QFont("Arial", 24, QFont.Bold)
+    painter.setFont(font)
+    painter.drawText(0, 0, 400, 200, Qt.AlignCenter, "DPMMV")
+    
+    painter.setPen(QColor(220, 220, 255))
+    font = QFont("Arial", 18)
+    painter.setFont(font)
+    painter.drawText(0, 30, 400, 200, Qt.AlignCenter, "Bells System")
+    
+    # Add loading text
+    painter.setPen(QColor(150, 150, 220))
+    font = QFont("Arial", 10)
+    painter.setFont(font)
+    painter.drawText(0, 190, 400, 50, Qt.AlignCenter, "Loading Bells...")
+    
+    # Draw a neon border glow
+    painter.setPen(QColor(0, 180, 255, 100))
+    painter.drawRoundedRect(2, 2, 396, 296, 15, 15)
+    
+    painter.end()
+    
+    return pixmap
+
+
 class SplashScreen(QSplashScreen):
     def __init__(self):
         super().__init__()
         self.setWindowFlag(Qt.FramelessWindowHint)
         self.setWindowFlag(Qt.WindowStaysOnTopHint)
         
-        # Create a custom pixmap for the splash screen
-        pixmap = QPixmap(400, 300)
-        pixmap.fill(Qt.transparent)
-        
-        # Create a painter to draw on the pixmap
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Draw glassmorphism effect
-        painter.setBrush(QColor(20, 20, 30, 220))
-        painter.setPen(Qt.NoPen)
-        painter.drawRoundedRect(0, 0, 400, 300, 15, 15)
-        
-        # Draw logo/text
-        painter.setPen(QColor(0, 200, 255))
-        font = QFont("Arial", 24, QFont.Bold)
-        painter.setFont(font)
-        painter.drawText(0, 0, 400, 200, Qt.AlignCenter, "DPMMV")
-        
-        painter.setPen(QColor(220, 220, 255))
-        font = QFont("Arial", 18)
-        painter.setFont(font)
-        painter.drawText(0, 30, 400, 200, Qt.AlignCenter, "Bells System")
-        
-        # Add loading text
-        painter.setPen(QColor(150, 150, 220))
-        font = QFont("Arial", 10)
-        painter.setFont(font)
-        painter.drawText(0, 190, 400, 50, Qt.AlignCenter, "Loading Bells...")
-        
-        # Draw a neon border glow
-        painter.setPen(QColor(0, 180, 255, 100))
-        painter.drawRoundedRect(2, 2, 396, 296, 15, 15)
-        
-        painter.end()
+        # Load the pre-rendered pixmap, painting it only if the asset is missing
+        pixmap = QPixmap(SPLASH_PIXMAP_PATH)
+        if pixmap.isNull():
+            pixmap = paint_splash_pixmap()
         
         # Set the pixmap to the splash screen
         self.setPixmap(pixmap)
@@ -66,16 +80,9 @@ class SplashScreen(QSplashScreen):
             }
         """)
         
-        # Set up the progress animation
-        self.counter = 0
-        self.progress_timer = QTimer(self)
-        self.progress_timer.timeout.connect(self.update_progress)
-        self.progress_timer.start(30)
-        
-    def update_progress(self):
-        """Update the progress bar animation"""
-        self.counter += 1
-        self.progress_bar.setValue(self.counter)
+        self.progress_bar.setValue(0)
         
-        if self.counter > 100:
-            self.progress_timer.stop()
\ No newline at end of file
+    def setProgress(self, pct):
+        """Show real startup progress, painting the bar immediately"""
+        self.progress_bar.setValue(max(0, min(100, int(pct))))
+        self.progress_bar.repaint()
@@ -0,0 +1,188 @@
+import numpy as np
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
+import scipy.fft
+from ui._audio_kernels import reduce_envelope, window_frames, power_to_db
+
+
+def compute_spectrogram(samples, sample_rate, nfft=256, noverlap=128):
+    """Compute a spectrogram in dB with a batched multi-threaded FFT
+    
+    Returns:
+        tuple: (Pxx, extent) with Pxx shaped (frequency, time)
+    """
+    samples = samples.astype(np.float32, copy=False)
+    if len(samples) < nfft:
+        samples = np.pad(samples, (0, nfft - len(samples)))
+        
+    # Window every frame in one pass into a buffer the FFT may overwrite
+    step = nfft - noverlap
+    window = np.hanning(nfft).astype(np.float32)
+    frames = np.empty(((len(samples) - nfft) // step + 1, nfft), dtype=np.float32)
+    window_frames(samples, nfft, step, window, frames)
+    
+    # float32 input keeps the FFT in complex64
+    spec = scipy.fft.rfft(frames, axis=1, workers=-1, overwrite_x=True)
+    
+    # Power in dB, fused into a single pass when numba is available
+    Pxx = np.empty(spec.shape, dtype=np.float32)
+    power_to_db(spec, Pxx)
+    
+    duration = len(samples) / sample_rate
+    return Pxx.T, (0, duration, 0, sample_rate / 2)
+
+
+def compute_waveform(samples, sample_rate, target):
+    """Time axis and points to plot, reduced to a min/max envelope for long files
+    
+    Returns:
+        tuple: (time, samples) ready for Line2D.set_data
+    """
+    # Create time axis
+    duration = len(samples) / sample_rate
+    
+    # Reduce long files to a min/max envelope of a few points per pixel
+    if len(samples) > 2 * target:
+        env_min = np.empty(target, dtype=np.float32)
+        env_max = np.empty(target, dtype=np.float32)
+        reduce_envelope(samples, target, env_min, env_max)
+        
+        samples = np.empty(2 * target, dtype=np.float32)
+        samples[0::2] = env_min
+        samples[1::2] = env_max
+        
+    time = np.linspace(0, duration, num=len(samples))
+    return time, samples
+
+
+class WaveformCanvas(FigureCanvas):
+    """Canvas for displaying audio waveform"""
+    
+    def __init__(self, parent=None, width=5, height=4, dpi=72):
+        self.fig = Figure(figsize=(width, height), dpi=dpi)
+        self.fig.patch.set_facecolor('#1e1e2e')
+        
+        self.axes = self.fig.add_subplot(111)
+        self.axes.set_facecolor('#1e1e2e')
+        self.axes.tick_params(axis='x', colors='white')
+        self.axes.tick_params(axis='y', colors='white')
+        self.axes.spines['bottom'].set_color('#353550')
+        self.axes.spines['top'].set_color('#353550')
+        self.axes.spines['left'].set_color('#353550')
+        self.axes.spines['right'].set_color('#353550')
+        self.axes.set_title('Waveform', color='white')
+        self.axes.set_xlabel('Time (s)', color='white')
+        self.axes.set_ylabel('Amplitude', color='white')
+        
+        # Persistent animated line, drawn over a cached background
+        self._line, = self.axes.plot([], [], color='#00a0ff', animated=True)
+        self._bg = None
+        
+        super().__init__(self.fig)
+        self.setParent(parent)
+        self.fig.tight_layout()
+        self.mpl_connect('draw_event', self._on_draw)
+        
+        self.setStyleSheet("background-color: #1e1e2e;")
+        
+    def _on_draw(self, event):
+        """Cache the static background after every full draw"""
+        # savefig draws through a print-resolution renderer; keep the screen background
+        if not self.is_saving():
+            self._bg = self.copy_from_bbox(self.axes.bbox)
+        self.axes.draw_artist(self._line)
+        
+    def envelope_target(self):
+        """Number of envelope bins for the current canvas width"""
+        return max(int(self.width() * self.fig.dpi / 72), 2000)
+        
+    def plot_waveform(self, samples, sample_rate):
+        """Plot audio waveform from decoded mono samples"""
+        try:
+            time, samples = compute_waveform(samples, sample_rate, self.envelope_target())
+        except Exception as e:
+            print(f"Error plotting waveform: {e}")
+            return False
+            
+        return self.show_waveform(time, samples)
+        
+    def show_waveform(self, time, samples):
+        """Draw precomputed waveform points"""
+        try:
+            duration = float(time[-1])
+            
+            # Plot waveform
+            self._line.set_data(time, samples)
+            low, high = float(samples.min()), float(samples.max())
+            pad = (high - low) * 0.05 or 1.0
+            xlim = (0.0, duration)
+            ylim = (low - pad, high + pad)
+            
+            # Blit the line alone while the axes are unchanged
+            if (self._bg is not None and xlim == self.axes.get_xlim()
+                    and ylim == self.axes.get_ylim()):
+                self.restore_region(self._bg)
+                self.axes.draw_artist(self._line)
+                self.blit(self.axes.bbox)
+            else:
+                self.axes.set_xlim(*xlim)
+                self.axes.set_ylim(*ylim)
+                self.draw()
+            return True
+        
+        except Exception as e:
+            print(f"Error plotting waveform: {e}")
+            return False
+
+
+class SpectrogramCanvas(FigureCanvas):
+    """Canvas for displaying audio spectrogram"""
+    
+    def __init__(self, parent=None, width=5, height=4, dpi=72):
+        self.fig = Figure(figsize=(width, height), dpi=dpi)
+        self.fig.patch.set_facecolor('#1e1e2e')
+        
+        self.axes = self.fig.add_subplot(111)
+        self.axes.set_facecolor('#1e1e2e')
+        self.axes.tick_params(axis='x', colors='white')
+        self.axes.tick_params(axis='y', colors='white')
+        self.axes.spines['bottom'].set_color('#353550')
+        self.axes.spines['top'].set_color('#353550')
+        self.axes.spines['left'].set_color('#353550')
+        self.axes.spines['right'].set_color('#353550')
+        self.axes.set_title('Spectrogram', color='white')
+        self.axes.set_xlabel('Time (s)', color='white')
+        self.axes.set_ylabel('Frequency (Hz)', color='white')
+        
+        # Placeholder image, updated in place for each sound
+        self._im = self.axes.imshow(
+            [[0]], cmap='viridis', origin='lower',
+            aspect='auto', extent=(0, 1, 0, 1)
+        )
+        
+        # Colorbar created and styled once, then kept in sync with the image
+        self._cbar = self.fig.colorbar(self._im)
+        self._cbar.ax.tick_params(labelcolor='white')
+        self._cbar.set_label('Intensity (dB)', color='white')
+        
+        super().__init__(self.fig)
+        self.setParent(parent)
+        self.fig.tight_layout()
+        
+        self.setStyleSheet("background-color: #1e1e2e;")
+        
+    def plot_spectrogram(self, Pxx, extent):
+        """Plot a precomputed audio spectrogram (in dB)"""
+        try:
+            # Plot spectrogram
+            self._im.set_array(Pxx)
+            self._im.set_extent(extent)
+            self._im.set_clim(float(Pxx.min()), float(Pxx.max()))
+            self._cbar.update_normal(self._im)
+            
+            self.draw()
+            return True
+        
+        except Exception as e:
+            print(f"Error plotting spectrogram: {e}")
+            return False
@@ -1,54 +1,143 @@
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame,
-    QScrollArea, QListWidget, QListWidgetItem, QDialog, QLineEdit,
+    QScrollArea, QListWidget, QDialog, QLineEdit,
     QFormLayout, QSpinBox, QCheckBox, QTextEdit, QColorDialog, QComboBox,
     QMessageBox, QGroupBox, QTableWidget, QTableWidgetItem, QHeaderView,
-    QToolButton, QMenu, QAction
+    QToolButton, QMenu, QAction, QTextBrowser, QListView, QAbstractItemView, QSplitter
 )
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QColor, QIcon, QFont
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QAbstractListModel, QModelIndex, QPoint
+from PyQt5.QtGui import QColor, QIcon, QFont, QBrush
+
+import string
+from contextlib import contextmanager
 
 from core.multi_zone_controller import Zone, ZoneScheduleRule
 
-class ZoneListItem(QListWidgetItem):
-    """Custom list item for displaying zones"""
-    
-    def __init__(self, zone, parent=None):
-        super().__init__(parent)
-        self.zone = zone
-        self.update_display()
-        
-    def update_display(self):
-        """Update item display based on zone properties"""
-        # Set text and tooltip
-        self.setText(self.zone.name)
-        self.setToolTip(self.zone.description)
-        
+# Rich text shown in the zone details panel
+_ZONE_DETAILS_TEMPLATE = string.Template("""
+<h2 style='color: $color'>$name</h2>
+<p><b>Status:</b> $status</p>
+<p><b>Description:</b> $description</p>
+<p><b>Volume Modifier:</b> $volume%</p>
+$bells
+""")
+
+_NO_ZONE_DETAILS = "Select a zone to view details"
+
+# Bell names offered when no scheduler is available
+_DEFAULT_BELL_NAMES = (
+    "School Start", "Period 1", "Break", "Period 2",
+    "Lunch", "Period 3", "End of Day"
+)
+
+# (zone color, enabled) -> (background brush, foreground brush, font), shared by all rows
+_BRUSH_CACHE = {}
+
+
+def _zone_item_style(color_name, enabled):
+    """Cached brushes and font for a zone list row"""
+    key = (color_name, enabled)
+    style = _BRUSH_CACHE.get(key)
+    if style is None:
         # Set background color based on zone color
-        color = QColor(self.zone.color)
+        color = QColor(color_name)
         color.setAlpha(50)  # Make it semi-transparent
-        self.setBackground(color)
+        background = QBrush(color)
         
-        # Use white or black text based on color brightness
-        if color.lightnessF() > 0.5:
-            self.setForeground(Qt.black)
+        # Use white or black text based on color brightness, gray when disabled
+        if not enabled:
+            foreground = QBrush(Qt.gray)
+        elif color.lightnessF() > 0.5:
+            foreground = QBrush(Qt.black)
         else:
-            self.setForeground(Qt.white)
-            
-        # Set disabled state
-        if not self.zone.enabled:
-            font = self.font()
-            font.setItalic(True)
-            self.setFont(font)
-            self.setForeground(Qt.gray)
+            foreground = QBrush(Qt.white)
+            
+        font = QFont()
+        font.setItalic(not enabled)
+        
+        style = _BRUSH_CACHE[key] = (background, foreground, font)
+    return style
+
+
+class ZoneListModel(QAbstractListModel):
+    """List model exposing Zone objects directly to a QListView"""
+    
+    ZoneRole = Qt.UserRole  # The Zone object itself
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._zones = []
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._zones)
+        
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+            
+        zone = self._zones[index.row()]
+        if role == Qt.DisplayRole:
+            return zone.name
+        if role == Qt.ToolTipRole:
+            return zone.description
+        if role == self.ZoneRole:
+            return zone
+            
+        # Colors and font depend only on zone color and enabled state
+        if role in (Qt.BackgroundRole, Qt.ForegroundRole, Qt.FontRole):
+            background, foreground, font = _zone_item_style(zone.color, zone.enabled)
+            if role == Qt.BackgroundRole:
+                return background
+            if role == Qt.ForegroundRole:
+                return foreground
+            return font
+            
+        return None
+        
+    def zone(self, row):
+        """Zone shown at row"""
+        return self._zones[row]
+        
+    def setZones(self, zones):
+        """Replace all zones in one model reset"""
+        self.beginResetModel()
+        self._zones = list(zones)
+        self.endResetModel()
+        
+    def appendZone(self, zone):
+        """Add a zone at the end of the list"""
+        row = len(self._zones)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._zones.append(zone)
+        self.endInsertRows()
+        
+    def replaceZone(self, row, zone):
+        """Show zone at row instead of the current one"""
+        self._zones[row] = zone
+        self.refreshZone(row)
+        
+    def refreshZone(self, row):
+        """Repaint row after its zone changed in place"""
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+        
+    def removeZone(self, row):
+        """Remove the zone at row"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._zones[row]
+        self.endRemoveRows()
 
 
 class ZoneEditorDialog(QDialog):
     """Dialog for editing zone properties"""
     
-    def __init__(self, zone=None, parent=None):
+    def __init__(self, zone=None, parent=None, bell_scheduler=None):
         super().__init__(parent)
         self.zone = zone
+        self.bell_scheduler = bell_scheduler
+        self._bells_populated = False  # bells_list is filled on next show
+        if bell_scheduler is not None:
+            bell_scheduler.bell_updated.connect(self.invalidate_bells)
         self.setWindowTitle("Zone Editor")
         self.setMinimumSize(450, 500)
         
@@ -56,9 +145,8 @@ class ZoneEditorDialog(QDialog):
         self.setup_ui()
         
         # Fill fields if editing existing zone
-        if zone:
-            self.populate_form()
-            
+        self.reset(zone)
+        
     def setup_ui(self):
         """Set up the dialog UI"""
         # Main layout
@@ -119,12 +207,6 @@ class ZoneEditorDialog(QDialog):
         self.bells_list.setSelectionMode(QListWidget.MultiSelection)
         self.bells_list.setEnabled(False)
         
-        # Add some dummy bells for now
-        self.bells_list.addItems([
-            "School Start", "Period 1", "Break", "Period 2",
-            "Lunch", "Period 3", "End of Day"
-        ])
-        
         self.bells_layout.addWidget(self.all_bells_checkbox)
         self.bells_layout.addWidget(self.bells_list)
         
@@ -138,22 +220,44 @@ class ZoneEditorDialog(QDialog):
         
         self.save_button = QPushButton("Save Zone")
         self.save_button.clicked.connect(self.save_zone)
-        self.save_button.setStyleSheet("""
-            background-color: #00a0ff;
-            color: white;
-            font-weight: bold;
-            padding: 8px 16px;
-        """)
+        self.save_button.setObjectName("saveZoneButton")
         
         self.button_layout.addWidget(self.cancel_button)
         self.button_layout.addWidget(self.save_button)
         
         self.layout.addLayout(self.button_layout)
         
+    @pyqtSlot()
+    def invalidate_bells(self):
+        """Refill the bells list on next show after the schedule changes"""
+        self._bells_populated = False
+        
+    def showEvent(self, event):
+        """Fill the bells list when the dialog is shown with a stale list"""
+        super().showEvent(event)
+        if self._bells_populated:
+            return
+            
+        if self.bell_scheduler and self.bell_scheduler.bells:
+            bell_names = [bell.name for bell in self.bell_scheduler.bells]
+        else:
+            bell_names = _DEFAULT_BELL_NAMES
+            
+        self.bells_list.setUpdatesEnabled(False)
+        self.bells_list.clear()
+        self.bells_list.addItems(bell_names)
+        self.bells_list.setUpdatesEnabled(True)
+        self._bells_populated = True
+        
+        # Apply the selection populate_form couldn't make on the empty list
+        self.select_allowed_bells()
+        
+    @pyqtSlot(int)
     def toggle_bells_list(self, state):
         """Enable or disable bells list based on checkbox state"""
         self.bells_list.setEnabled(not state)
         
+    @pyqtSlot()
     def choose_color(self):
         """Open color dialog and set zone color"""
         color = QColorDialog.getColor(self.color, self)
@@ -161,6 +265,26 @@ class ZoneEditorDialog(QDialog):
             self.color = color
             self.color_button.setStyleSheet(f"background-color: {color.name()}")
             
+    def reset(self, zone=None):
+        """Prepare the dialog for a new zone (None) or for editing zone"""
+        self.zone = zone
+        self.zone_data = None
+        
+        if zone:
+            self.populate_form()
+            return
+            
+        # Restore the defaults for a new zone
+        self.name_edit.clear()
+        self.description_edit.clear()
+        self.enabled_checkbox.setChecked(True)
+        self.volume_spinner.setValue(100)
+        self.color = QColor("#00a0ff")
+        self.color_button.setStyleSheet(f"background-color: {self.color.name()}")
+        self.all_bells_checkbox.setChecked(True)
+        self.bells_list.clearSelection()
+        self.bells_list.setEnabled(False)
+        
     def populate_form(self):
         """Fill form with zone data if editing existing zone"""
         if not self.zone:
@@ -183,12 +307,28 @@ class ZoneEditorDialog(QDialog):
             self.all_bells_checkbox.setChecked(False)
             self.bells_list.setEnabled(True)
             
-            # Select matching bells
+            self.select_allowed_bells()
+            
+    def select_allowed_bells(self):
+        """Select the bells the edited zone is restricted to"""
+        self.bells_list.clearSelection()
+        if not self.zone or not self.zone.bells_allowed:
+            return
+            
+        # Select matching bells without a signal or repaint per item
+        allowed = set(self.zone.bells_allowed)
+        self.bells_list.blockSignals(True)
+        self.bells_list.setUpdatesEnabled(False)
+        try:
             for i in range(self.bells_list.count()):
                 item = self.bells_list.item(i)
-                if item.text() in self.zone.bells_allowed:
+                if item.text() in allowed:
                     item.setSelected(True)
-                    
+        finally:
+            self.bells_list.setUpdatesEnabled(True)
+            self.bells_list.blockSignals(False)
+                
+    @pyqtSlot()
     def save_zone(self):
         """Save zone data and close dialog"""
         # Validate zone name
@@ -229,6 +369,12 @@ class ZoneManager(QWidget):
         super().__init__(parent)
         self.zone_controller = zone_controller
         self.bell_scheduler = bell_scheduler
+        self._editor_dialog = None  # Built on first add/edit, then reused
+        
+        # zone_changed coalescing (see batch/suppress)
+        self._signal_depth = 0
+        self._suppress_depth = 0
+        self._pending_emit = False
         
         # Set up the UI
         self.setup_ui()
@@ -244,20 +390,12 @@ class ZoneManager(QWidget):
         # Add header with title and controls
         self.header_layout = QHBoxLayout()
         
+        # Styles come from assets/styles/zone_manager.qss, matched by object name
         self.title = QLabel("Bell Zones")
-        self.title.setStyleSheet("""
-            font-size: 18px;
-            font-weight: bold;
-            color: white;
-        """)
+        self.title.setObjectName("zoneManagerTitle")
         
         self.add_button = QPushButton("+ Add Zone")
-        self.add_button.setStyleSheet("""
-            background-color: #00a0ff;
-            color: white;
-            border-radius: 5px;
-            padding: 5px 10px;
-        """)
+        self.add_button.setObjectName("addZoneButton")
         self.add_button.clicked.connect(self.add_zone)
         
         self.header_layout.addWidget(self.title)
@@ -265,54 +403,37 @@ class ZoneManager(QWidget):
         self.header_layout.addWidget(self.add_button)
         
         # Add zone list
-        self.zone_list = QListWidget()
-        self.zone_list.setStyleSheet("""
-            QListWidget {
-                background-color: #1e1e2e;
-                border-radius: 10px;
-                border: 1px solid #353550;
-                padding: 5px;
-            }
-            QListWidget::item {
-                padding: 10px;
-                margin: 2px;
-                border-radius: 5px;
-            }
-            QListWidget::item:selected {
-                background-color: #404060;
-            }
-            QListWidget::item:hover {
-                background-color: #353550;
-            }
-        """)
-        self.zone_list.itemDoubleClicked.connect(self.edit_zone)
+        self.zone_model = ZoneListModel(self)
+        self.zone_list = QListView()
+        self.zone_list.setObjectName("zoneList")
+        self.zone_list.setModel(self.zone_model)
+        self.zone_list.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.zone_list.doubleClicked.connect(self.edit_zone)
         
         # Add context menu to zone list
         self.zone_list.setContextMenuPolicy(Qt.CustomContextMenu)
         self.zone_list.customContextMenuRequested.connect(self.show_context_menu)
         
+        # Context menu built once; only the toggle text changes per zone
+        self._ctx_menu = QMenu(self)
+        self._edit_action = self._ctx_menu.addAction("Edit Zone")
+        self._toggle_action = self._ctx_menu.addAction("Disable")
+        self._remove_action = self._ctx_menu.addAction("Remove Zone")
+        
         # Add zone details panel
         self.details_panel = QFrame()
         self.details_panel.setFrameShape(QFrame.StyledPanel)
-        self.details_panel.setStyleSheet("""
-            background-color: #1e1e2e;
-            border-radius: 10px;
-            border: 1px solid #353550;
-            padding: 10px;
-        """)
+        self.details_panel.setObjectName("zoneDetailsPanel")
         
         self.details_layout = QVBoxLayout(self.details_panel)
         
         self.details_title = QLabel("Zone Details")
-        self.details_title.setStyleSheet("""
-            font-size: 16px;
-            font-weight: bold;
-            color: #00a0ff;
-        """)
+        self.details_title.setObjectName("zoneDetailsTitle")
         
-        self.details_content = QLabel("Select a zone to view details")
-        self.details_content.setWordWrap(True)
-        self.details_content.setStyleSheet("color: white;")
+        self.details_content = QTextBrowser()
+        self.details_content.setObjectName("zoneDetailsContent")
+        self._details_html = None  # Last HTML handed to details_content
+        self._set_details_html(_NO_ZONE_DETAILS)
         
         self.details_layout.addWidget(self.details_title)
         self.details_layout.addWidget(self.details_content)
@@ -356,22 +477,67 @@ class ZoneManager(QWidget):
         self.layout.addWidget(self.splitter)
         
         # Connect signals
-        self.zone_list.itemSelectionChanged.connect(self.update_zone_details)
-        
+        self.zone_list.selectionModel().selectionChanged.connect(self.update_zone_details)
+        
+    @contextmanager
+    def batch(self):
+        """Coalesce zone_changed emissions inside the block into one on exit"""
+        self._signal_depth += 1
+        try:
+            yield
+        finally:
+            self._signal_depth -= 1
+            if self._signal_depth == 0 and self._pending_emit:
+                self._pending_emit = False
+                self.zone_changed.emit()
+                
+    @contextmanager
+    def suppress(self):
+        """Drop zone_changed emissions made inside the block"""
+        self._suppress_depth += 1
+        try:
+            yield
+        finally:
+            self._suppress_depth -= 1
+            
+    def _emit_zone_changed(self):
+        """Emit zone_changed now, or defer/drop it inside batch()/suppress()"""
+        if self._suppress_depth:
+            return
+        if self._signal_depth:
+            self._pending_emit = True
+        else:
+            self.zone_changed.emit()
+            
     def load_zones(self):
         """Load zones from controller"""
-        self.zone_list.clear()
-        
-        if not self.zone_controller:
-            return
+        zones = self.zone_controller.get_all_zones() if self.zone_controller else []
+        with self._quiet_selection():
+            self.zone_model.setZones(zones)
             
-        for zone in self.zone_controller.get_all_zones():
-            item = ZoneListItem(zone)
-            self.zone_list.addItem(item)
+    @contextmanager
+    def _quiet_selection(self):
+        """Mute selection signals during programmatic list changes, then resync once"""
+        selection_model = self.zone_list.selectionModel()
+        selection_model.blockSignals(True)
+        try:
+            yield
+        finally:
+            selection_model.blockSignals(False)
+            self.zone_list.viewport().update()
+            self.update_zone_details()
             
+    def _editor(self, zone=None):
+        """Shared zone editor dialog, reset for zone"""
+        if self._editor_dialog is None:
+            self._editor_dialog = ZoneEditorDialog(parent=self, bell_scheduler=self.bell_scheduler)
+        self._editor_dialog.reset(zone)
+        return self._editor_dialog
+        
+    @pyqtSlot()
     def add_zone(self):
         """Add a new zone"""
-        dialog = ZoneEditorDialog(parent=self)
+        dialog = self._editor()
         
         if dialog.exec_():
             # Get zone data
@@ -382,18 +548,26 @@ class ZoneManager(QWidget):
                 self.zone_controller.add_zone(zone)
                 
             # Add to list
-            item = ZoneListItem(zone)
-            self.zone_list.addItem(item)
+            with self._quiet_selection():
+                self.zone_model.appendZone(zone)
             
             # Emit signal
-            self.zone_changed.emit()
+            self._emit_zone_changed()
             
-    def edit_zone(self, item):
-        """Edit a zone from list item"""
-        if not isinstance(item, ZoneListItem):
+    def _selected_row(self):
+        """Row of the selected zone, or None"""
+        indexes = self.zone_list.selectionModel().selectedIndexes()
+        return indexes[0].row() if indexes else None
+        
+    @pyqtSlot(QModelIndex)
+    def edit_zone(self, index):
+        """Edit the zone at a list index"""
+        if not index.isValid():
             return
             
-        dialog = ZoneEditorDialog(item.zone, self)
+        row = index.row()
+        zone = self.zone_model.zone(row)
+        dialog = self._editor(zone)
         
         if dialog.exec_():
             # Get updated zone data
@@ -401,145 +575,145 @@ class ZoneManager(QWidget):
             
             # Update in controller
             if self.zone_controller:
-                self.zone_controller.update_zone(item.zone.id, updated_zone)
+                self.zone_controller.update_zone(zone.id, updated_zone)
                 
-            # Update item
-            item.zone = updated_zone
-            item.update_display()
+            # Update row
+            self.zone_model.replaceZone(row, updated_zone)
             
             # Update details if this is the selected zone
-            if item.isSelected():
+            if row == self._selected_row():
                 self.update_zone_details()
                 
             # Emit signal
-            self.zone_changed.emit()
+            self._emit_zone_changed()
             
+    @pyqtSlot()
     def edit_selected_zone(self):
         """Edit the currently selected zone"""
-        items = self.zone_list.selectedItems()
-        if items:
-            self.edit_zone(items[0])
+        row = self._selected_row()
+        if row is not None:
+            self.edit_zone(self.zone_model.index(row))
             
+    @pyqtSlot()
     def toggle_selected_zone(self):
         """Toggle enabled state of selected zone"""
-        items = self.zone_list.selectedItems()
-        if not items or not self.zone_controller:
+        row = self._selected_row()
+        if row is None or not self.zone_controller:
             return
             
-        item = items[0]
+        zone = self.zone_model.zone(row)
         
         # Toggle enabled state
-        enabled = not item.zone.enabled
+        enabled = not zone.enabled
         
         # Update in controller
-        self.zone_controller.enable_zone(item.zone.id, enabled)
+        self.zone_controller.enable_zone(zone.id, enabled)
         
         # Update zone object
-        item.zone.enabled = enabled
+        zone.enabled = enabled
         
         # Update display
-        item.update_display()
+        self.zone_model.refreshZone(row)
         
         # Update details
         self.update_zone_details()
         
         # Emit signal
-        self.zone_changed.emit()
+        self._emit_zone_changed()
         
+    @pyqtSlot()
     def remove_selected_zone(self):
         """Remove the selected zone"""
-        items = self.zone_list.selectedItems()
-        if not items or not self.zone_controller:
+        row = self._selected_row()
+        if row is None or not self.zone_controller:
             return
             
-        item = items[0]
+        zone = self.zone_model.zone(row)
         
         # Confirm deletion
         if QMessageBox.question(
             self, "Confirm Deletion",
-            f"Are you sure you want to delete zone '{item.zone.name}'?",
+            f"Are you sure you want to delete zone '{zone.name}'?",
             QMessageBox.Yes | QMessageBox.No
         ) != QMessageBox.Yes:
             return
             
         # Remove from controller
-        self.zone_controller.remove_zone(item.zone.id)
-        
-        # Remove from list
-        row = self.zone_list.row(item)
-        self.zone_list.takeItem(row)
-        
-        # Clear details
-        self.details_content.setText("Select a zone to view details")
-        
-        # Disable buttons
-        self.edit_button.setEnabled(False)
-        self.toggle_button.setEnabled(False)
-        self.remove_button.setEnabled(False)
+        self.zone_controller.remove_zone(zone.id)
         
+        # Remove from list; the details panel and buttons resync on exit
+        with self._quiet_selection():
+            self.zone_model.removeZone(row)
+            
         # Emit signal
-        self.zone_changed.emit()
+        self._emit_zone_changed()
         
+    @pyqtSlot()
     def update_zone_details(self):
         """Update the details panel with selected zone info"""
-        items = self.zone_list.selectedItems()
+        row = self._selected_row()
         
-        if not items:
-            self.details_content.setText("Select a zone to view details")
-            self.edit_button.setEnabled(False)
-            self.toggle_button.setEnabled(False)
-            self.remove_button.setEnabled(False)
+        if row is None:
+            self._set_details_html(_NO_ZONE_DETAILS)
+            self._set_zone_buttons_enabled(False)
             return
             
-        item = items[0]
-        zone = item.zone
+        zone = self.zone_model.zone(row)
         
         # Format details
-        details = f"""
-        <h2 style='color: {zone.color}'>{zone.name}</h2>
-        <p><b>Status:</b> {'Enabled' if zone.enabled else 'Disabled'}</p>
-        <p><b>Description:</b> {zone.description}</p>
-        <p><b>Volume Modifier:</b> {zone.volume_modifier}%</p>
-        """
-        
         if zone.bells_allowed:
-            details += "<p><b>Restricted to Bells:</b></p><ul>"
-            for bell in zone.bells_allowed:
-                details += f"<li>{bell}</li>"
-            details += "</ul>"
+            bells_html = "".join(f"<li>{bell}</li>" for bell in zone.bells_allowed)
+            bells = f"<p><b>Restricted to Bells:</b></p><ul>{bells_html}</ul>"
         else:
-            details += "<p><b>Bell Restrictions:</b> None (all bells allowed)</p>"
+            bells = "<p><b>Bell Restrictions:</b> None (all bells allowed)</p>"
             
-        self.details_content.setText(details)
+        details = _ZONE_DETAILS_TEMPLATE.substitute(
+            color=zone.color,
+            name=zone.name,
+            status='Enabled' if zone.enabled else 'Disabled',
+            description=zone.description,
+            volume=zone.volume_modifier,
+            bells=bells
+        )
+        
+        self._set_details_html(details)
         
         # Enable buttons
-        self.edit_button.setEnabled(True)
-        self.toggle_button.setEnabled(True)
-        self.remove_button.setEnabled(True)
+        self._set_zone_buttons_enabled(True)
         
         # Update toggle button text
         self.toggle_button.setText("Disable" if zone.enabled else "Enable")
         
+    def _set_zone_buttons_enabled(self, enabled):
+        """Enable or disable the zone action buttons with a single repaint"""
+        self.button_panel.setUpdatesEnabled(False)
+        self.edit_button.setEnabled(enabled)
+        self.toggle_button.setEnabled(enabled)
+        self.remove_button.setEnabled(enabled)
+        self.button_panel.setUpdatesEnabled(True)
+        
+    def _set_details_html(self, html):
+        """Show html in the details panel, skipping the re-parse if it is unchanged"""
+        if html != self._details_html:
+            self._details_html = html
+            self.details_content.setHtml(html)
+            
+    @pyqtSlot(QPoint)
     def show_context_menu(self, position):
         """Show context menu for zone list"""
-        items = self.zone_list.selectedItems()
-        if not items:
+        row = self._selected_row()
+        if row is None:
             return
             
-        item = items[0]
-        zone = item.zone
-        
-        menu = QMenu()
+        zone = self.zone_model.zone(row)
         
-        edit_action = menu.addAction("Edit Zone")
-        toggle_action = menu.addAction("Disable" if zone.enabled else "Enable")
-        remove_action = menu.addAction("Remove Zone")
+        self._toggle_action.setText("Disable" if zone.enabled else "Enable")
         
-        action = menu.exec_(self.zone_list.mapToGlobal(position))
+        action = self._ctx_menu.exec_(self.zone_list.mapToGlobal(position))
         
-        if action == edit_action:
-            self.edit_zone(item)
-        elif action == toggle_action:
+        if action == self._edit_action:
+            self.edit_zone(self.zone_model.index(row))
+        elif action == self._toggle_action:
             self.toggle_selected_zone()
-        elif action == remove_action:
+        elif action == self._remove_action:
             self.remove_selected_zone()
\ No newline at end of file
